@@ -101,6 +101,8 @@ async def main():
     print(f"  Alta (>0.8): {stats['nodes_by_confidence']['high']}")
     print(f"  Media (0.5-0.8): {stats['nodes_by_confidence']['medium']}")
     print(f"  Baja (<0.5): {stats['nodes_by_confidence']['low']}")
+    
+    await consolidator.close()
 
 if __name__ == "__main__":
     asyncio.run(main())
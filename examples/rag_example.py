@@ -53,6 +53,8 @@ async def main():
     print("\n📊 Estadísticas:")
     print(f"Total de documentos: {stats['vector_store']['total_documents']}")
     print(f"Modelo: {stats['model']['name']}")
+    
+    await agent.close()
 
 if __name__ == "__main__":
     asyncio.run(main())
@@ -13,6 +13,9 @@ from ...core.config import AGENT_CONFIG
 @dataclass
 class AudioChunk:
     """Chunk de audio para procesar."""
+    # Se crea uno por bloque de audio capturado: sin __dict__ por instancia
+    __slots__ = ("data", "timestamp", "sample_rate")
+    
     data: np.ndarray
     timestamp: float
     sample_rate: int
@@ -40,10 +40,11 @@ class WhisperProcessor:
             if not self.is_initialized():
                 raise RuntimeError("Whisper no está inicializado")
             
-            # Convertir a float32 y normalizar
+            # Convertir a float32 (copia propia) y normalizar en sitio
             audio = audio.astype(np.float32)
-            if audio.max() > 1.0:
-                audio = audio / audio.max()
+            peak = audio.max()
+            if peak > 1.0:
+                audio /= peak
             
             # Transcribir
             result = self.model.transcribe(audio)
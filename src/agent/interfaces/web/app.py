@@ -8,6 +8,7 @@ import threading
 import logging
 import os
 import asyncio
+import uuid
 from ...core.base import AgentInterface, AgentContext
 from ...core.config import AGENT_CONFIG
 from ...models.rag_model import AgenticNutritionRAG
@@ -27,7 +28,7 @@ class StreamlitInterface(AgentInterface):
         # Estado de la aplicación
         if 'session_context' not in st.session_state:
             st.session_state.session_context = AgentContext(
-                session_id=str(hash(threading.current_thread())),
+                session_id=str(uuid.uuid4()),
                 language=AGENT_CONFIG["language"]
             )
         
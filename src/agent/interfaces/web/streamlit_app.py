@@ -3,10 +3,9 @@ Interfaz web usando Streamlit.
 """
 import streamlit as st
 from streamlit_webrtc import webrtc_streamer, WebRtcMode
-import av
-import numpy as np
 import logging
 import asyncio
+import uuid
 from typing import Optional
 from ...core.base import AgentInterface, AgentContext
 from ..voice.audio_processor import AudioManager
@@ -61,7 +60,7 @@ class StreamlitInterface(AgentInterface):
         """Configura el estado de la sesión."""
         if "context" not in st.session_state:
             st.session_state.context = AgentContext(
-                session_id=str(hash(time.time())),
+                session_id=str(uuid.uuid4()),
                 language=AGENT_CONFIG["language"]
             )
         
@@ -1,18 +1,36 @@
 from typing import List, Dict, Any
 import logging
+from functools import lru_cache
 from transformers import pipeline
 from keybert import KeyBERT
 from .schemas import VideoSegment, VideoKnowledge, SearchQuery, SearchResult, RAGResponse
+from ...utils import LRUCache
 
 logger = logging.getLogger(__name__)
 
+# Etiquetas candidatas para la clasificación zero-shot
+SEGMENT_TOPICS = ["nutrición", "deporte", "salud", "dieta", "entrenamiento",
+                  "suplementos", "rendimiento", "recuperación", "lesiones"]
+QUERY_INTENTS = ["preguntar", "comparar", "explicar", "listar", "recomendar"]
+QUERY_TOPICS = ["nutrición", "deporte", "salud", "dieta", "entrenamiento"]
+
+@lru_cache(maxsize=None)
+def _load_pipeline(task: str):
+    """Carga un pipeline de transformers una sola vez y lo comparte entre procesadores."""
+    return pipeline(task)
+
+@lru_cache(maxsize=1)
+def _load_keyword_model() -> KeyBERT:
+    """Carga el modelo KeyBERT una sola vez y lo comparte entre procesadores."""
+    return KeyBERT()
+
 class VideoProcessor:
     """Procesador avanzado de videos."""
     
     def __init__(self):
-        self.keyword_model = KeyBERT()
-        self.sentiment_analyzer = pipeline("sentiment-analysis")
-        self.zero_shot = pipeline("zero-shot-classification")
+        self.keyword_model = _load_keyword_model()
+        self.sentiment_analyzer = _load_pipeline("sentiment-analysis")
+        self.zero_shot = _load_pipeline("zero-shot-classification")
         
     def process_transcript(self, transcript: str, video_metadata: Dict[str, Any]) -> VideoKnowledge:
         """
@@ -48,9 +66,7 @@ class VideoProcessor:
             segment.sentiment = float(sentiment['score']) * (1 if sentiment['label'] == 'POSITIVE' else -1)
             
             # Identificar temas
-            candidate_topics = ["nutrición", "deporte", "salud", "dieta", "entrenamiento", 
-                              "suplementos", "rendimiento", "recuperación", "lesiones"]
-            topics = self.zero_shot(segment.content, candidate_topics)
+            topics = self.zero_shot(segment.content, SEGMENT_TOPICS)
             segment.topics = [label for score, label in zip(topics['scores'], topics['labels']) 
                             if score > 0.3]
         
@@ -86,20 +102,29 @@ class VideoProcessor:
 class QueryProcessor:
     """Procesador avanzado de consultas."""
     
-    def __init__(self):
-        self.keyword_model = KeyBERT()
-        self.zero_shot = pipeline("zero-shot-classification")
+    def __init__(self, cache_size: int = 128):
+        self.keyword_model = _load_keyword_model()
+        self.zero_shot = _load_pipeline("zero-shot-classification")
+        # Consultas ya procesadas (LRU): el análisis es determinista
+        self._query_cache: LRUCache[str, SearchQuery] = LRUCache(cache_size)
         
     def process_query(self, query: str) -> SearchQuery:
         """
         Procesa y estructura la consulta del usuario.
         
+        Las consultas repetidas se sirven desde caché; el SearchQuery
+        devuelto se comparte y no debe modificarse.
+        
         Args:
             query: Consulta original
             
         Returns:
             SearchQuery estructurada
         """
+        cached = self._query_cache.get(query)
+        if cached is not None:
+            return cached
+        
         # Extraer palabras clave
         keywords = self.keyword_model.extract_keywords(
             query,
@@ -111,22 +136,23 @@ class QueryProcessor:
         )
         
         # Detectar intención
-        intents = ["preguntar", "comparar", "explicar", "listar", "recomendar"]
-        intent_result = self.zero_shot(query, intents)
+        intent_result = self.zero_shot(query, QUERY_INTENTS)
         intent = intent_result['labels'][0]
         
         # Identificar temas
-        topics = ["nutrición", "deporte", "salud", "dieta", "entrenamiento"]
-        topic_result = self.zero_shot(query, topics)
+        topic_result = self.zero_shot(query, QUERY_TOPICS)
         relevant_topics = [label for score, label in zip(topic_result['scores'], topic_result['labels']) 
                          if score > 0.3]
         
-        return SearchQuery(
+        search_query = SearchQuery(
             query=query,
             intent=intent,
             keywords=[k[0] for k in keywords],
             topics=relevant_topics
         )
+        
+        self._query_cache.put(query, search_query)
+        return search_query
 
 class ResponseGenerator:
     """Generador avanzado de respuestas."""
@@ -7,13 +7,15 @@ Consolida la funcionalidad de los módulos:
 - rag_system.py
 """
 
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Set
 from datetime import datetime
+import heapq
 import logging
 
+import numpy as np
+
 from langchain.chat_models import ChatOpenAI
 from langchain.embeddings import OpenAIEmbeddings
-from langchain.vectorstores import FAISS
 from langchain.text_splitter import RecursiveCharacterTextSplitter
 from langchain.chains import ConversationalRetrievalChain
 from langchain.memory import ConversationBufferMemory
@@ -21,8 +23,14 @@ from langchain.prompts import PromptTemplate
 
 from pydantic import BaseModel
 
+from ...utils import LRUCache
+
 logger = logging.getLogger(__name__)
 
+# Pesos del score de relevancia de un chunk
+SIMILARITY_WEIGHT = 0.7
+KEYWORD_WEIGHT = 0.3
+
 class VideoKnowledge(BaseModel):
     """Conocimiento estructurado extraído de un video."""
     title: str
@@ -143,7 +151,8 @@ class AgenticNutritionRAG:
                  model_name: str = "gpt-3.5-turbo",
                  temperature: float = 0.7,
                  chunk_size: int = 1000,
-                 chunk_overlap: int = 200):
+                 chunk_overlap: int = 200,
+                 embedding_cache_size: int = 1024):
         """Inicializa el modelo RAG.
         
         Args:
@@ -152,6 +161,7 @@ class AgenticNutritionRAG:
             temperature: Temperatura para generación
             chunk_size: Tamaño de chunks para splitting
             chunk_overlap: Superposición entre chunks
+            embedding_cache_size: Máximo de embeddings de chunks en caché
         """
         self.llm = ChatOpenAI(
             openai_api_key=openai_api_key,
@@ -160,6 +170,8 @@ class AgenticNutritionRAG:
         )
         
         self.embeddings = OpenAIEmbeddings(openai_api_key=openai_api_key)
+        # Embeddings de chunks ya calculados (texto -> vector), en orden LRU
+        self._chunk_embeddings: LRUCache[str, List[float]] = LRUCache(embedding_cache_size)
         self.text_splitter = RecursiveCharacterTextSplitter(
             chunk_size=chunk_size,
             chunk_overlap=chunk_overlap
@@ -181,6 +193,8 @@ class AgenticNutritionRAG:
             Respuesta detallada:""",
             input_variables=["context", "question"]
         )
+        # Cadena de QA: depende solo de llm, memoria y prompt, se crea una vez
+        self._qa_chain: Optional[ConversationalRetrievalChain] = None
         
         self.knowledge_scout = KnowledgeScout(AGENT_CONFIG["knowledge_scout"])
         self.fact_validator = FactValidator(AGENT_CONFIG["fact_validator"])
@@ -228,9 +242,12 @@ class AgenticNutritionRAG:
         """
         summary = await self.llm.apredict(summary_prompt)
         
+        # Embeddings de todos los chunks en una sola llamada
+        chunk_embeddings = self.embeddings.embed_documents(chunks)
+        
         # Procesar chunks
         segments = []
-        for i, chunk in enumerate(chunks):
+        for i, (chunk, embedding) in enumerate(zip(chunks, chunk_embeddings)):
             # Extraer palabras clave
             keywords_prompt = f"""
             Extrae 5-7 palabras clave sobre nutrición de este texto:
@@ -243,7 +260,7 @@ class AgenticNutritionRAG:
                 "start_time": i * 30, # Estimado
                 "end_time": (i + 1) * 30,
                 "keywords": keywords.split("\n"),
-                "embedding": self.embeddings.embed_query(chunk)
+                "embedding": embedding
             })
         
         return VideoKnowledge(
@@ -260,20 +277,39 @@ class AgenticNutritionRAG:
             processed_at=datetime.now()
         )
     
-    def _score_chunk(self, chunk: str, query: str) -> float:
-        """Calcula un score de relevancia para un chunk."""
-        # Embedding similarity
-        query_embedding = self.embeddings.embed_query(query)
-        chunk_embedding = self.embeddings.embed_query(chunk)
-        similarity = sum(q * c for q, c in zip(query_embedding, chunk_embedding))
+    def _embed_chunks(self, chunks: List[str]) -> List[List[float]]:
+        """Obtiene los embeddings de varios chunks, reutilizando los ya calculados.
         
-        # Keyword matching
-        query_keywords = set(query.lower().split())
-        chunk_keywords = set(chunk.lower().split())
-        keyword_overlap = len(query_keywords & chunk_keywords) / len(query_keywords)
+        Los chunks que no están en caché se calculan en una sola llamada.
+        """
+        missing = [
+            chunk for chunk in dict.fromkeys(chunks)
+            if chunk not in self._chunk_embeddings
+        ]
+        computed = (
+            dict(zip(missing, self.embeddings.embed_documents(missing)))
+            if missing else {}
+        )
+        
+        # Resolver todos los vectores antes de guardar: un lote mayor que la
+        # caché no debe descartar entradas que aún se van a leer
+        embeddings = [
+            computed[chunk] if chunk in computed else self._chunk_embeddings.get(chunk)
+            for chunk in chunks
+        ]
+        for chunk, embedding in zip(chunks, embeddings):
+            self._chunk_embeddings.put(chunk, embedding)
+        return embeddings
+    
+    def _keyword_overlap(self, chunk: str, query_keywords: Set[str]) -> float:
+        """Calcula la fracción de palabras de la consulta presentes en un chunk.
         
-        # Combine scores
-        return 0.7 * similarity + 0.3 * keyword_overlap
+        Args:
+            chunk: Texto del chunk
+            query_keywords: Palabras de la consulta en minúsculas
+        """
+        chunk_keywords = set(chunk.lower().split())
+        return len(query_keywords & chunk_keywords) / len(query_keywords)
     
     async def get_response(self, 
                           query: str,
@@ -283,28 +319,44 @@ class AgenticNutritionRAG:
         if not context:
             context = []  # TODO: Implementar recuperación de base de datos
         
-        # Scoring y ranking de chunks
+        segments = [segment for doc in context for segment in doc.get("segments", [])]
+        
+        # Scoring y ranking de chunks; la consulta se procesa una sola vez
         scored_chunks = []
-        for doc in context:
-            for segment in doc.get("segments", []):
-                score = self._score_chunk(segment["content"], query)
-                scored_chunks.append((score, segment))
+        if segments:
+            query_embedding = np.asarray(self.embeddings.embed_query(query))
+            query_keywords = set(query.lower().split())
+            
+            # Similitud de todos los chunks con la consulta en una sola operación;
+            # el peso se aplica al vector de consulta, así el producto
+            # matriz-vector ya devuelve la similitud ponderada
+            chunk_embeddings = np.asarray(
+                self._embed_chunks([segment["content"] for segment in segments])
+            )
+            scores = chunk_embeddings @ (SIMILARITY_WEIGHT * query_embedding)
+            scores += KEYWORD_WEIGHT * np.fromiter(
+                (self._keyword_overlap(segment["content"], query_keywords) for segment in segments),
+                dtype=np.float64,
+                count=len(segments)
+            )
+            scored_chunks = list(zip(scores.tolist(), segments))
         
-        # Ordenar por score y tomar los mejores
-        scored_chunks.sort(reverse=True)
-        best_chunks = [c[1] for c in scored_chunks[:3]]
+        # Tomar los mejores por score sin ordenar toda la lista
+        top_chunks = heapq.nlargest(3, scored_chunks, key=lambda c: c[0])
+        best_chunks = [c[1] for c in top_chunks]
         
         # Construir contexto para respuesta
         context_text = "\n\n".join(c["content"] for c in best_chunks)
         
         # Generar respuesta
-        qa_chain = ConversationalRetrievalChain(
-            llm=self.llm,
-            memory=self.memory,
-            combine_docs_chain_kwargs={"prompt": self.qa_prompt}
-        )
+        if self._qa_chain is None:
+            self._qa_chain = ConversationalRetrievalChain(
+                llm=self.llm,
+                memory=self.memory,
+                combine_docs_chain_kwargs={"prompt": self.qa_prompt}
+            )
         
-        response = await qa_chain.arun(
+        response = await self._qa_chain.arun(
             question=query,
             chat_history=self.memory.chat_memory.messages
         )
@@ -318,7 +370,7 @@ class AgenticNutritionRAG:
         followup_questions = [q.strip() for q in followup.split("\n") if q.strip()]
         
         # Calcular confianza
-        confidence = sum(c[0] for c in scored_chunks[:3]) / 3
+        confidence = sum(c[0] for c in top_chunks) / 3
         
         return RAGResponse(
             answer=response,
@@ -9,7 +9,6 @@ from typing import Dict, List, Optional, Tuple, Any
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 from youtube_transcript_api import YouTubeTranscriptApi
-from youtube_transcript_api.formatters import TextFormatter
 from youtube_transcript_api._errors import (
     TranscriptsDisabled,
     NoTranscriptFound,
@@ -22,6 +21,12 @@ from ..core.context import AgentContext
 
 logger = logging.getLogger(__name__)
 
+# Patrones de URL soportados, compilados una vez y compartidos por todas las instancias
+VIDEO_ID_PATTERNS = (
+    re.compile(r'(?:v=|\/)([0-9A-Za-z_-]{11}).*'),
+    re.compile(r'youtu\.be\/([0-9A-Za-z_-]{11})'),
+)
+
 class YouTubeProcessor(AgentProcessor):
     """Procesador de videos de YouTube."""
 
@@ -68,14 +73,8 @@ class YouTubeProcessor(AgentProcessor):
         Raises:
             ValueError: Si la URL no es válida.
         """
-        # Patrones de URL soportados
-        patterns = [
-            r'(?:v=|\/)([0-9A-Za-z_-]{11}).*',
-            r'youtu\.be\/([0-9A-Za-z_-]{11})',
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, url)
+        for pattern in VIDEO_ID_PATTERNS:
+            match = pattern.search(url)
             if match:
                 return match.group(1)
         
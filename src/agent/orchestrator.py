@@ -5,6 +5,7 @@ Coordina y decide el flujo de trabajo entre los agentes especializados.
 from typing import Dict, Any, Optional, List
 import json
 import logging
+import time
 from pydantic import BaseModel, Field
 from enum import Enum
 
@@ -31,6 +32,17 @@ class TaskType(Enum):
     SYNTHESIS = "synthesis"  # Solo síntesis
     EVALUATION = "evaluation"  # Solo evaluación
 
+# Secuencia de agentes para cada tipo de tarea
+EXECUTION_PLANS: Dict[TaskType, List[str]] = {
+    TaskType.RESEARCH: ["scout", "validator", "synthesizer", "evaluator"],
+    TaskType.VALIDATION: ["validator", "evaluator"],
+    TaskType.SYNTHESIS: ["synthesizer", "evaluator"],
+    TaskType.EVALUATION: ["evaluator"],
+}
+
+# Agentes cuyos pasos fallidos se reintentan siempre
+RETRYABLE_AGENTS = frozenset({"validator", "evaluator"})
+
 class AcquisitionTask(BaseModel):
     """Tarea de adquisición de conocimiento."""
     query: str = Field(description="Consulta o pregunta a investigar")
@@ -60,28 +72,21 @@ class KnowledgeOrchestrator:
     
     def _plan_execution(self, task: AcquisitionTask) -> List[str]:
         """Planifica la secuencia de agentes basada en el tipo de tarea."""
-        if task.task_type == TaskType.RESEARCH:
-            return ["scout", "validator", "synthesizer", "evaluator"]
-        elif task.task_type == TaskType.VALIDATION:
-            return ["validator", "evaluator"]
-        elif task.task_type == TaskType.SYNTHESIS:
-            return ["synthesizer", "evaluator"]
-        elif task.task_type == TaskType.EVALUATION:
-            return ["evaluator"]
-        
-        return ["scout", "validator", "synthesizer", "evaluator"]
+        plan = EXECUTION_PLANS.get(task.task_type, EXECUTION_PLANS[TaskType.RESEARCH])
+        return list(plan)
     
     def _should_retry(self, step: ExecutionStep, task: AcquisitionTask) -> bool:
         """Determina si un paso fallido debe reintentarse."""
         if task.priority == TaskPriority.HIGH:
             return True
-        if step.agent in ["validator", "evaluator"]:
+        if step.agent in RETRYABLE_AGENTS:
             return True
         return False
     
     async def _execute_step(self, agent_name: str, data: Any, task: AcquisitionTask) -> ExecutionStep:
         """Ejecuta un paso específico del proceso."""
         step = ExecutionStep(agent=agent_name, status="running")
+        start = time.perf_counter()
         
         try:
             agent = getattr(self, agent_name)
@@ -111,6 +116,7 @@ class KnowledgeOrchestrator:
             step.result = result
             step.status = "completed" if result.success else "failed"
             step.metrics = agent.get_metrics().dict()
+            step.metrics["execution_time"] = time.perf_counter() - start
             
         except Exception as e:
             logger.error(f"Error en {agent_name}: {str(e)}")
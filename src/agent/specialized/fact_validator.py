@@ -2,6 +2,7 @@
 Agente especializado en validación de información.
 """
 from typing import List, Dict, Any
+import asyncio
 import json
 import openai
 from pydantic import BaseModel, Field
@@ -25,6 +26,7 @@ class FactValidator(BaseSpecializedAgent):
         """Inicializa el agente."""
         super().__init__(config)
         self.min_confidence = config.get('min_confidence', 0.3)
+        self.max_concurrency = config.get('max_concurrency', 8)
         self.validation_prompt = """
         Valida la siguiente información y determina su confiabilidad:
         
@@ -69,20 +71,47 @@ class FactValidator(BaseSpecializedAgent):
             validated_results = []
             validation_errors = []
             
-            for result in search_results:
-                try:
-                    validation = await self._validate_result(result)
-                    if validation.get('confidence', 0) >= self.min_confidence:
-                        validated_results.append(
-                            ValidationResult(
-                                content=validation.get('content', result.snippet),
-                                source=result.url,
-                                confidence=validation.get('confidence', 0.5),
-                                validation_notes=validation.get('validation_notes', [])
-                            )
-                        )
-                except Exception as e:
-                    validation_errors.append(f"Error validando {result.url}: {str(e)}")
+            # Validar en paralelo, limitando las llamadas simultáneas a la API
+            semaphore = asyncio.Semaphore(self.max_concurrency)
+            
+            async def _validate_one(result: SearchResult):
+                async with semaphore:
+                    try:
+                        return await self._validate_result(result), None
+                    except Exception as e:
+                        return None, e
+            
+            # Resultados con el mismo contenido producen el mismo prompt:
+            # se valida cada contenido una sola vez y la respuesta se aplica
+            # a todos los resultados que lo comparten
+            keys = [(r.snippet, r.url, r.source_type) for r in search_results]
+            unique_results: Dict[tuple, SearchResult] = {}
+            for key, result in zip(keys, search_results):
+                unique_results.setdefault(key, result)
+            
+            outcomes = dict(zip(
+                unique_results,
+                await asyncio.gather(
+                    *(_validate_one(result) for result in unique_results.values())
+                )
+            ))
+            
+            # Descartar cuanto antes errores y resultados de baja confianza
+            for key, result in zip(keys, search_results):
+                validation, error = outcomes[key]
+                if error is not None:
+                    validation_errors.append(f"Error validando {result.url}: {str(error)}")
+                    continue
+                if validation.get('confidence', 0) < self.min_confidence:
+                    continue
+                validated_results.append(
+                    ValidationResult(
+                        content=validation.get('content', result.snippet),
+                        source=result.url,
+                        confidence=validation.get('confidence', 0.5),
+                        validation_notes=validation.get('validation_notes', [])
+                    )
+                )
             
             if not validated_results:
                 return AgentResult(
@@ -7,12 +7,17 @@ import jwt
 from jwt.exceptions import InvalidTokenError
 from functools import wraps
 from .models import User, Role, Permission, TokenPayload
+from ..utils import LRUCache
 
 # Configuración de JWT
 JWT_SECRET = "your-secret-key"  # TODO: Mover a variables de entorno
 JWT_ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 30
 
+# Tokens ya verificados -> payload, reutilizados mientras no expiren
+VERIFIED_TOKEN_CACHE_SIZE = 256
+_verified_tokens: LRUCache[str, TokenPayload] = LRUCache(VERIFIED_TOKEN_CACHE_SIZE)
+
 def create_access_token(user: User) -> str:
     """Crea un token JWT para el usuario."""
     expires_delta = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
@@ -43,6 +48,24 @@ def decode_token(token: str) -> Optional[TokenPayload]:
     except InvalidTokenError:
         return None
 
+def _decode_token_cached(token: str) -> Optional[TokenPayload]:
+    """
+    Decodifica el token verificando la firma una sola vez mientras siga vigente.
+    
+    Los tokens expirados se descartan y se vuelven a decodificar, por lo que
+    se rechazan igual que con decode_token.
+    """
+    payload = _verified_tokens.get(token)
+    if payload is not None:
+        if datetime.utcnow().timestamp() <= payload.exp:
+            return payload
+        _verified_tokens.pop(token)
+    
+    payload = decode_token(token)
+    if payload is not None:
+        _verified_tokens.put(token, payload)
+    return payload
+
 def requires_auth(*required_permissions: Permission):
     """Decorador para proteger endpoints/funciones."""
     def decorator(func):
@@ -54,7 +77,7 @@ def requires_auth(*required_permissions: Permission):
                 raise AuthError("Token no proporcionado")
             
             # Validar token
-            payload = decode_token(token)
+            payload = _decode_token_cached(token)
             if not payload:
                 raise AuthError("Token inválido")
             
@@ -1,7 +1,6 @@
 from typing import List, Dict, Any, Optional
 import os
 from datetime import datetime
-import numpy as np
 from pydantic import BaseModel
 from langchain.embeddings import OpenAIEmbeddings
 from langchain.vectorstores import FAISS
@@ -43,11 +42,12 @@ class VectorStore:
     
     async def add_documents(self, documents: List[VectorDocument]) -> None:
         """Agrega documentos al almacén vectorial."""
-        # Convertir a formato de Langchain
+        # Convertir a formato de Langchain (un único timestamp por lote)
+        timestamp = datetime.now().isoformat()
         langchain_docs = []
         for doc in documents:
             metadata = doc.metadata.copy()
-            metadata["timestamp"] = datetime.now().isoformat()
+            metadata["timestamp"] = timestamp
             
             langchain_docs.append(
                 Document(
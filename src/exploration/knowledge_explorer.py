@@ -7,9 +7,11 @@ Consolida la funcionalidad de:
 - knowledge_viz.py
 """
 
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, FrozenSet, Set, Tuple
 import logging
 import json
+import heapq
+from collections import Counter
 from datetime import datetime
 
 import networkx as nx
@@ -35,6 +37,8 @@ class KnowledgeExplorer:
         self.knowledge_base_path = knowledge_base_path
         self.knowledge_base = self._load_knowledge_base()
         self.graph = self._build_knowledge_graph()
+        self.term_index = self._build_term_index()
+        self.term_postings = self._build_term_postings()
         
     def _load_knowledge_base(self) -> List[VideoKnowledge]:
         """Carga la base de conocimiento desde JSON."""
@@ -71,19 +75,50 @@ class KnowledgeExplorer:
                     
         return G
         
-    def analyze_topics(self) -> pd.DataFrame:
-        """Analiza distribución de temas."""
-        topics = []
+    def _build_term_index(self) -> List[Tuple[VideoKnowledge, FrozenSet[str], FrozenSet[str], FrozenSet[str]]]:
+        """
+        Precalcula los términos de título, temas y palabras clave de cada video.
+        
+        Returns:
+            Lista de (video, términos del título, términos de temas, palabras clave)
+        """
+        index = []
         for video in self.knowledge_base:
-            topics.extend(video.main_topics)
-            
-        df = pd.DataFrame(topics, columns=["topic"])
-        topic_counts = df["topic"].value_counts()
+            keywords = frozenset(
+                k.lower()
+                for segment in video.segments
+                for k in segment["keywords"]
+            )
+            index.append((
+                video,
+                frozenset(video.title.lower().split()),
+                frozenset(" ".join(video.main_topics).lower().split()),
+                keywords
+            ))
+        return index
+        
+    def _build_term_postings(self) -> Dict[str, Set[int]]:
+        """
+        Construye un índice invertido término -> posiciones en term_index.
+        
+        Returns:
+            Diccionario de término a conjunto de posiciones de videos
+        """
+        postings: Dict[str, Set[int]] = {}
+        for position, (_, title_terms, topic_terms, keywords) in enumerate(self.term_index):
+            for term in title_terms | topic_terms | keywords:
+                postings.setdefault(term, set()).add(position)
+        return postings
         
-        return pd.DataFrame({
-            "topic": topic_counts.index,
-            "count": topic_counts.values
-        })
+    def analyze_topics(self) -> pd.DataFrame:
+        """Analiza distribución de temas."""
+        # Contar directamente y construir un único DataFrame con el resultado
+        topic_counts = Counter(
+            topic
+            for video in self.knowledge_base
+            for topic in video.main_topics
+        )
+        return pd.DataFrame(topic_counts.most_common(), columns=["topic", "count"])
         
     def generate_wordcloud(self, 
                           width: int = 800, 
@@ -162,54 +197,69 @@ class KnowledgeExplorer:
             Lista de videos relacionados con sus metadatos
         """
         # TODO: Implementar búsqueda semántica
-        results = []
+        scored = []
         query_terms = set(query.lower().split())
         
-        for video in self.knowledge_base:
+        # Solo los videos que comparten algún término con la consulta
+        # pueden tener relevancia positiva
+        candidates: Set[int] = set()
+        for term in query_terms:
+            candidates |= self.term_postings.get(term, set())
+        
+        for position in sorted(candidates):
+            video, title_terms, topic_terms, keywords = self.term_index[position]
+            
             # Calcular relevancia
             relevance = 0
             
             # Coincidencia en título
-            title_terms = set(video.title.lower().split())
             relevance += len(query_terms & title_terms) * 2
             
             # Coincidencia en temas
-            topic_terms = set(" ".join(video.main_topics).lower().split())
             relevance += len(query_terms & topic_terms) * 1.5
             
             # Coincidencia en palabras clave
-            keywords = set()
-            for segment in video.segments:
-                keywords.update(k.lower() for k in segment["keywords"])
             relevance += len(query_terms & keywords)
             
             if relevance > 0:
-                results.append({
-                    "title": video.title,
-                    "url": video.url,
-                    "channel": video.channel,
-                    "relevance": relevance,
-                    "topics": video.main_topics,
-                    "summary": video.summary
-                })
+                scored.append((relevance, video))
                 
-        # Ordenar por relevancia
-        results.sort(key=lambda x: x["relevance"], reverse=True)
-        return results[:n_results]
+        # Tomar los más relevantes sin ordenar todos los candidatos
+        top = heapq.nlargest(n_results, scored, key=lambda x: x[0])
+        return [
+            {
+                "title": video.title,
+                "url": video.url,
+                "channel": video.channel,
+                "relevance": relevance,
+                "topics": video.main_topics,
+                "summary": video.summary
+            }
+            for relevance, video in top
+        ]
         
     def export_statistics(self) -> Dict[str, Any]:
         """Exporta estadísticas de la base de conocimiento."""
+        # Un único recorrido de la base para todas las métricas
+        total_segments = 0
+        topics = set()
+        channels = set()
+        keywords = set()
+        for video in self.knowledge_base:
+            total_segments += len(video.segments)
+            topics.update(video.main_topics)
+            channels.add(video.channel)
+            for segment in video.segments:
+                keywords.update(segment["keywords"])
+        
         stats = {
             "total_videos": len(self.knowledge_base),
-            "total_segments": sum(len(v.segments) for v in self.knowledge_base),
-            "unique_topics": len(set(t for v in self.knowledge_base 
-                                   for t in v.main_topics)),
-            "unique_channels": len(set(v.channel for v in self.knowledge_base)),
-            "avg_segments_per_video": sum(len(v.segments) for v in self.knowledge_base) / 
+            "total_segments": total_segments,
+            "unique_topics": len(topics),
+            "unique_channels": len(channels),
+            "avg_segments_per_video": total_segments / 
                                     len(self.knowledge_base) if self.knowledge_base else 0,
-            "total_keywords": len(set(k for v in self.knowledge_base 
-                                    for s in v.segments 
-                                    for k in s["keywords"])),
+            "total_keywords": len(keywords),
             "last_updated": datetime.now().isoformat()
         }
         
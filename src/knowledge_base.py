@@ -1,17 +1,24 @@
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 import json
 from datetime import datetime
 from pathlib import Path
 import sqlite3
 import logging
-from langchain_openai import ChatOpenAI
-from langchain_core.prompts import PromptTemplate
 import numpy as np
 from sentence_transformers import SentenceTransformer
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+def _unpack_embeddings(rows: List[tuple]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Separa filas (id, embedding BLOB) en un array de ids y una matriz
+    float32 contigua, construida desde un único buffer.
+    """
+    ids, blobs = zip(*rows)
+    embeddings = np.frombuffer(b"".join(blobs), dtype=np.float32).reshape(len(blobs), -1)
+    return np.array(ids), embeddings
+
 class KnowledgeBase:
     def __init__(self, db_path: str = "knowledge_base.db", embeddings_model: str = "all-MiniLM-L6-v2"):
         """
@@ -84,8 +91,8 @@ class KnowledgeBase:
             references: Lista de referencias
             category: Categoría del conocimiento
         """
-        # Generar embedding para el contenido
-        embedding = self.encoder.encode(content)
+        # Generar embedding para el contenido (float32, el mismo tipo que se lee)
+        embedding = self.encoder.encode(content).astype(np.float32, copy=False)
         
         with sqlite3.connect(self.db_path) as conn:
             for concept in concepts:
@@ -110,40 +117,47 @@ class KnowledgeBase:
                     )
         
         # Buscar y establecer relaciones con conocimiento existente
-        self._establish_relationships(knowledge_id, content, concepts)
+        self._establish_relationships(knowledge_id, embedding)
     
     def _establish_relationships(self, 
                                knowledge_id: int, 
-                               content: str, 
-                               concepts: List[str]) -> None:
+                               new_embedding: np.ndarray) -> None:
         """
         Establece relaciones entre el nuevo conocimiento y el existente.
-        """
-        # Obtener embeddings del nuevo contenido
-        new_embedding = self.encoder.encode(content)
         
+        Args:
+            knowledge_id: ID del nuevo item de conocimiento
+            new_embedding: Embedding ya calculado del nuevo contenido
+        """
         with sqlite3.connect(self.db_path) as conn:
             # Obtener todos los items existentes
-            cursor = conn.execute("SELECT id, embedding FROM knowledge_items WHERE id != ?", (knowledge_id,))
+            rows = conn.execute(
+                "SELECT id, embedding FROM knowledge_items WHERE id != ?",
+                (knowledge_id,)
+            ).fetchall()
             
-            for row in cursor:
-                existing_id = row[0]
-                existing_embedding = np.frombuffer(row[1])
-                
-                # Calcular similitud coseno
-                similarity = np.dot(new_embedding, existing_embedding) / \
-                           (np.linalg.norm(new_embedding) * np.linalg.norm(existing_embedding))
-                
-                # Si la similitud es alta, crear una relación
-                if similarity > 0.7:
-                    conn.execute(
-                        """
-                        INSERT INTO relationships 
-                        (source_id, target_id, relationship_type, confidence_score)
-                        VALUES (?, ?, ?, ?)
-                        """,
-                        (knowledge_id, existing_id, "related", float(similarity))
-                    )
+            if not rows:
+                return
+            
+            # Calcular todas las similitudes coseno de una vez
+            ids, embeddings = _unpack_embeddings(rows)
+            similarities = embeddings @ new_embedding / (
+                np.linalg.norm(embeddings, axis=1) * np.linalg.norm(new_embedding)
+            )
+            
+            # Crear relaciones solo para los items con similitud alta
+            mask = similarities > 0.7
+            conn.executemany(
+                """
+                INSERT INTO relationships 
+                (source_id, target_id, relationship_type, confidence_score)
+                VALUES (?, ?, ?, ?)
+                """,
+                [
+                    (knowledge_id, int(existing_id), "related", float(similarity))
+                    for existing_id, similarity in zip(ids[mask], similarities[mask])
+                ]
+            )
     
     def query_knowledge(self, 
                        query: str, 
@@ -163,44 +177,62 @@ class KnowledgeBase:
             Lista de items de conocimiento relevantes
         """
         # Generar embedding para la consulta
-        query_embedding = self.encoder.encode(query)
+        query_embedding = self.encoder.encode(query).astype(np.float32, copy=False)
         
         with sqlite3.connect(self.db_path) as conn:
-            conn.create_function("cosine_similarity", 2, self._cosine_similarity_sqlite)
-            
             sql = """
-                SELECT 
-                    id, concept, content, evidence_score, novelty_score,
-                    cosine_similarity(embedding, ?) as similarity
+                SELECT id, embedding
                 FROM knowledge_items
                 WHERE evidence_score >= ?
             """
-            params = [query_embedding.tobytes(), min_evidence_score]
+            params = [min_evidence_score]
             
             if category:
                 sql += " AND category = ?"
                 params.append(category)
             
-            sql += " ORDER BY similarity DESC LIMIT ?"
-            params.append(limit)
+            candidates = conn.execute(sql, params).fetchall()
+            if not candidates:
+                return []
             
-            cursor = conn.execute(sql, params)
+            # Similitud coseno de todos los candidatos en una sola operación
+            ids, embeddings = _unpack_embeddings(candidates)
+            similarities = embeddings @ query_embedding / (
+                np.linalg.norm(embeddings, axis=1) * np.linalg.norm(query_embedding)
+            )
+            top = np.argsort(-similarities, kind="stable")[:limit]
+            
+            # Cargar el detalle solo de los mejores resultados
+            top_ids = [int(ids[i]) for i in top]
+            placeholders = ",".join("?" * len(top_ids))
+            details = {
+                row[0]: row[1:]
+                for row in conn.execute(
+                    f"""
+                    SELECT id, concept, content, evidence_score, novelty_score
+                    FROM knowledge_items
+                    WHERE id IN ({placeholders})
+                    """,
+                    top_ids
+                )
+            }
             
             results = []
-            for row in cursor:
+            for knowledge_id, similarity in zip(top_ids, similarities[top]):
+                concept, content, evidence_score, novelty_score = details[knowledge_id]
                 item = {
-                    "id": row[0],
-                    "concept": row[1],
-                    "content": row[2],
-                    "evidence_score": row[3],
-                    "novelty_score": row[4],
-                    "similarity": row[5]
+                    "id": knowledge_id,
+                    "concept": concept,
+                    "content": content,
+                    "evidence_score": evidence_score,
+                    "novelty_score": novelty_score,
+                    "similarity": float(similarity)
                 }
                 
                 # Obtener referencias
                 citations = conn.execute(
                     "SELECT citation FROM citations WHERE knowledge_id = ?",
-                    (row[0],)
+                    (knowledge_id,)
                 ).fetchall()
                 item["references"] = [c[0] for c in citations]
                 
@@ -212,7 +244,7 @@ class KnowledgeBase:
                     JOIN knowledge_items t ON r.target_id = t.id
                     WHERE r.source_id = ?
                     """,
-                    (row[0],)
+                    (knowledge_id,)
                 ).fetchall()
                 item["relationships"] = [
                     {"concept": r[0], "type": r[1], "confidence": r[2]}
@@ -223,13 +255,6 @@ class KnowledgeBase:
             
             return results
     
-    @staticmethod
-    def _cosine_similarity_sqlite(embedding1_bytes, embedding2_bytes):
-        """Función auxiliar para calcular similitud coseno en SQLite."""
-        v1 = np.frombuffer(embedding1_bytes)
-        v2 = np.frombuffer(embedding2_bytes)
-        return float(np.dot(v1, v2) / (np.linalg.norm(v1) * np.linalg.norm(v2)))
-    
     def get_knowledge_summary(self) -> Dict[str, Any]:
         """
         Obtiene un resumen del conocimiento almacenado.
@@ -1,6 +1,7 @@
 """
 Utilidades para el manejo de modelos de lenguaje.
 """
+from functools import lru_cache
 from typing import Optional
 from ..config import LLM_CONFIG
 from .llm_router import LLMRouter, TaskType
@@ -33,6 +34,16 @@ def create_llm_router() -> LLMRouter:
     
     return router
 
+@lru_cache(maxsize=1)
+def _get_shared_router() -> LLMRouter:
+    """
+    Retorna un router compartido, creado una sola vez a partir de la configuración.
+    
+    Returns:
+        Router configurado reutilizado entre llamadas
+    """
+    return create_llm_router()
+
 def get_llm_for_task(task_type: Optional[TaskType] = None):
     """
     Obtiene el modelo de lenguaje más apropiado para una tarea.
@@ -43,7 +54,7 @@ def get_llm_for_task(task_type: Optional[TaskType] = None):
     Returns:
         Modelo de lenguaje configurado para la tarea
     """
-    router = create_llm_router()
+    router = _get_shared_router()
     return router.get_provider(task_type).llm
 
 # Ejemplo de uso:
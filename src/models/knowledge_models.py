@@ -5,6 +5,7 @@ Modelos Pydantic para la base de conocimientos.
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 from enum import Enum
+from statistics import fmean
 from pydantic import BaseModel, Field, validator
 import numpy as np
 
@@ -33,6 +34,8 @@ class KnowledgeFragment(BaseModel):
     content: str
     start_time: Optional[float] = None  # Para videos
     end_time: Optional[float] = None    # Para videos
+    frame_count: Optional[int] = None   # Para videos
+    scene_change: bool = False          # Para videos
     embedding: Optional[List[float]] = None
     keywords: List[str] = Field(default_factory=list)
     topics: List[str] = Field(default_factory=list)
@@ -53,6 +56,7 @@ class Citation(BaseModel):
     source_url: str
     context: Optional[str] = None
     page_number: Optional[int] = None
+    timestamp: Optional[float] = None  # Para videos
     accessed_date: datetime = Field(default_factory=datetime.now)
 
 class KnowledgeItem(BaseModel):
@@ -70,26 +74,27 @@ class KnowledgeItem(BaseModel):
     
     def calculate_quality_metrics(self) -> None:
         """Calcula métricas de calidad del item."""
-        # Coherencia entre fragmentos
-        fragment_similarities = []
-        for i, frag1 in enumerate(self.fragments):
-            for frag2 in self.fragments[i+1:]:
-                if frag1.embedding and frag2.embedding:
-                    sim = np.dot(frag1.embedding, frag2.embedding)
-                    fragment_similarities.append(sim)
-        
-        if fragment_similarities:
-            self.quality_metrics["coherence"] = float(np.mean(fragment_similarities))
+        # Coherencia entre fragmentos: similitud media de todos los pares,
+        # tomada del triángulo superior de la matriz de Gram
+        embeddings = [f.embedding for f in self.fragments if f.embedding]
+        if len(embeddings) > 1:
+            matrix = np.asarray(embeddings)
+            gram = matrix @ matrix.T
+            pairs = gram[np.triu_indices(len(embeddings), k=1)]
+            self.quality_metrics["coherence"] = float(pairs.mean())
             
         # Confianza promedio
         confidences = [f.confidence_score for f in self.fragments]
-        self.quality_metrics["avg_confidence"] = float(np.mean(confidences))
+        self.quality_metrics["avg_confidence"] = fmean(confidences) if confidences else 0.0
         
         # Completitud
         self.quality_metrics["completeness"] = min(1.0, len(self.fragments) / 10)
         
-        # Riqueza de metadatos
-        metadata_fields = len([f for f in self.source.dict().values() if f is not None])
+        # Riqueza de metadatos (lectura directa de atributos, sin copiar la fuente)
+        metadata_fields = sum(
+            1 for name in self.source.__fields__
+            if getattr(self.source, name) is not None
+        )
         self.quality_metrics["metadata_richness"] = metadata_fields / len(self.source.__fields__)
 
 class KnowledgeQuery(BaseModel):
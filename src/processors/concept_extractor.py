@@ -6,24 +6,49 @@ from typing import List, Dict, Tuple, Set
 import re
 import logging
 from collections import defaultdict
+from functools import lru_cache
 import spacy
+from spacy.language import Language
 from spacy.tokens import Doc, Span
 from ..models.video_models import KnowledgeDomain
 
 logger = logging.getLogger(__name__)
 
+# Expresiones de limpieza compiladas una sola vez
+_WHITESPACE_RE = re.compile(r'\s+')
+_PUNCTUATION_RE = re.compile(r'\s*([.,;:])\s*')
+
+# Palabras clave que refuerzan la confianza de una definición
+DEFINITION_KEY_WORDS = ("is", "means", "refers", "consists", "defined")
+
+# Conectores que, cerca de una relación, aumentan su confianza
+RELATION_CONTEXT_WORDS = ("therefore", "because", "since", "as")
+
+@lru_cache(maxsize=None)
+def _load_nlp(model_name: str) -> Language:
+    """
+    Carga un modelo spaCy una sola vez y lo comparte entre instancias.
+    
+    Args:
+        model_name: Nombre del modelo spaCy
+        
+    Returns:
+        Pipeline de spaCy cargado
+    """
+    try:
+        return spacy.load(model_name)
+    except OSError:
+        logger.info("Descargando modelo spaCy...")
+        spacy.cli.download(model_name)
+        return spacy.load(model_name)
+
 class ConceptExtractor:
     """Extrae conceptos y sus relaciones del contenido."""
     
     def __init__(self):
         """Inicializa el extractor de conceptos."""
         # Cargar modelo spaCy ligero para español/inglés
-        try:
-            self.nlp = spacy.load("en_core_web_sm")
-        except OSError:
-            logger.info("Descargando modelo spaCy...")
-            spacy.cli.download("en_core_web_sm")
-            self.nlp = spacy.load("en_core_web_sm")
+        self.nlp = _load_nlp("en_core_web_sm")
         
         # Patrones para identificar definiciones
         self.definition_patterns = [
@@ -65,6 +90,16 @@ class ConceptExtractor:
             ]
         }
         
+        # Compilar los patrones una sola vez por instancia
+        self.definition_patterns = [
+            re.compile(pattern, re.IGNORECASE)
+            for pattern in self.definition_patterns
+        ]
+        self.relation_patterns = {
+            rel_type: [re.compile(pattern, re.IGNORECASE) for pattern in patterns]
+            for rel_type, patterns in self.relation_patterns.items()
+        }
+        
         # Términos comunes que no deben ser conceptos
         self.stopwords = {
             "this", "that", "these", "those", "it", "they", "he", "she",
@@ -82,9 +117,9 @@ class ConceptExtractor:
             Texto limpio y normalizado
         """
         # Eliminar saltos de línea y espacios múltiples
-        text = re.sub(r'\s+', ' ', text)
+        text = _WHITESPACE_RE.sub(' ', text)
         # Normalizar puntuación
-        text = re.sub(r'\s*([.,;:])\s*', r'\1 ', text)
+        text = _PUNCTUATION_RE.sub(r'\1 ', text)
         # Eliminar espacios al inicio y final
         return text.strip()
     
@@ -93,12 +128,11 @@ class ConceptExtractor:
         Preprocesa el texto usando spaCy.
         
         Args:
-            text: Texto a procesar
+            text: Texto ya limpio (ver _clean_text)
             
         Returns:
             Documento spaCy procesado
         """
-        text = self._clean_text(text)
         return self.nlp(text)
     
     def _extract_noun_phrases(self, doc: Doc) -> Dict[str, float]:
@@ -113,20 +147,23 @@ class ConceptExtractor:
         """
         noun_phrases = {}
         
+        # Oraciones en minúsculas calculadas una sola vez para todas las frases
+        sentences = [sent.text.lower() for sent in doc.sents]
+        
         for chunk in doc.noun_chunks:
             # Limpiar y normalizar
             phrase = chunk.text.lower().strip()
+            words = phrase.split()
             
             # Filtrar frases no deseadas
-            if (2 <= len(phrase.split()) <= 5 and 
-                not any(w in self.stopwords for w in phrase.split())):
+            if 2 <= len(words) <= 5 and self.stopwords.isdisjoint(words):
                 
                 # Calcular puntuación basada en:
                 # - Longitud de la frase (frases más largas suelen ser más específicas)
                 # - Frecuencia en el documento
                 # - Posición en la oración
-                length_score = min(len(phrase.split()) / 5.0, 1.0)
-                freq_score = sum(1 for sent in doc.sents if phrase in sent.text.lower()) / len(list(doc.sents))
+                length_score = min(len(words) / 5.0, 1.0)
+                freq_score = sum(1 for sent in sentences if phrase in sent) / len(sentences)
                 pos_score = 1.0 if chunk.start == 0 else 0.5  # Mayor peso si está al inicio
                 
                 score = (length_score + freq_score + pos_score) / 3.0
@@ -139,21 +176,21 @@ class ConceptExtractor:
         Extrae definiciones de conceptos usando patrones.
         
         Args:
-            text: Texto a analizar
+            text: Texto ya limpio (ver _clean_text)
             
         Returns:
             Diccionario de concepto -> {definición, confianza}
         """
         definitions = {}
-        text = self._clean_text(text)
         
         for pattern in self.definition_patterns:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
+            matches = pattern.finditer(text)
             for match in matches:
                 concept = match.group("concept").strip().lower()
                 definition = match.group("definition").strip()
                 
-                if len(concept.split()) <= 5 and not any(w in self.stopwords for w in concept.split()):
+                concept_words = concept.split()
+                if len(concept_words) <= 5 and self.stopwords.isdisjoint(concept_words):
                     # Calcular confianza basada en:
                     # - Longitud de la definición
                     # - Presencia de palabras clave
@@ -161,8 +198,8 @@ class ConceptExtractor:
                     def_length = len(definition.split())
                     length_score = min(def_length / 20.0, 1.0)  # Normalizar a max 20 palabras
                     
-                    key_words = {"is", "means", "refers", "consists", "defined"}
-                    kw_score = sum(1 for w in key_words if w in definition.lower()) / len(key_words)
+                    definition_lower = definition.lower()
+                    kw_score = sum(1 for w in DEFINITION_KEY_WORDS if w in definition_lower) / len(DEFINITION_KEY_WORDS)
                     
                     confidence = (length_score + kw_score) / 2.0
                     
@@ -180,35 +217,38 @@ class ConceptExtractor:
         Extrae relaciones entre conceptos usando patrones.
         
         Args:
-            text: Texto a analizar
+            text: Texto ya limpio (ver _clean_text)
             
         Returns:
             Diccionario de tipo_relación -> [{source, target, confidence}]
         """
         relations = defaultdict(list)
-        text = self._clean_text(text)
         
         for rel_type, patterns in self.relation_patterns.items():
             for pattern in patterns:
-                matches = re.finditer(pattern, text, re.IGNORECASE)
+                matches = pattern.finditer(text)
                 for match in matches:
                     source = match.group("source").strip().lower()
                     target = match.group("target").strip().lower()
+                    source_words = source.split()
+                    target_words = target.split()
                     
-                    if (len(source.split()) <= 5 and len(target.split()) <= 5 and
-                        not any(w in self.stopwords for w in source.split() + target.split())):
+                    if (len(source_words) <= 5 and len(target_words) <= 5 and
+                        self.stopwords.isdisjoint(source_words) and
+                        self.stopwords.isdisjoint(target_words)):
                         
                         # Calcular confianza
-                        context_before = text[max(0, match.start() - 50):match.start()].strip()
-                        context_after = text[match.end():min(len(text), match.end() + 50)].strip()
+                        start, end = match.span()
+                        context_before = text[max(0, start - 50):start].strip()
+                        context_after = text[end:min(len(text), end + 50)].strip()
+                        context = context_before + context_after
                         
                         # Factores de confianza:
                         # - Longitud de los conceptos
                         # - Contexto alrededor
                         # - Patrón utilizado
-                        length_score = min((len(source.split()) + len(target.split())) / 10.0, 1.0)
-                        context_score = 1.0 if any(w in context_before + context_after 
-                                                for w in ["therefore", "because", "since", "as"]) else 0.5
+                        length_score = min((len(source_words) + len(target_words)) / 10.0, 1.0)
+                        context_score = 1.0 if any(w in context for w in RELATION_CONTEXT_WORDS) else 0.5
                         
                         confidence = (length_score + context_score) / 2.0
                         
@@ -225,13 +265,19 @@ class ConceptExtractor:
         Extrae conceptos específicos de cada dominio con puntuación.
         
         Args:
-            text: Texto a analizar
+            text: Texto ya limpio (ver _clean_text)
             domains: Lista de dominios detectados
             
         Returns:
             Diccionario de dominio -> {concepto: puntuación}
         """
         domain_concepts = defaultdict(dict)
+        
+        # Sin dominios o sin texto no hay conceptos que asignar: evitar el
+        # análisis con spaCy, que es la parte más costosa
+        if not domains or not text.strip():
+            return domain_concepts
+        
         doc = self._preprocess_text(text)
         
         # Extraer todas las frases nominales con puntuación
@@ -239,11 +285,15 @@ class ConceptExtractor:
         
         # Asignar conceptos a dominios basado en keywords y calcular relevancia
         for domain in domains:
+            # Sin conceptos clave ningún concepto puede relacionarse con el dominio
+            if not domain.key_concepts:
+                continue
+            key_concepts = [kw.lower() for kw in domain.key_concepts]
+            
             for concept, base_score in noun_phrases.items():
                 # Calcular relevancia para el dominio
-                keyword_matches = sum(1 for kw in domain.key_concepts 
-                                   if kw.lower() in concept)
-                domain_score = (keyword_matches / len(domain.key_concepts)) if domain.key_concepts else 0
+                keyword_matches = sum(1 for kw in key_concepts if kw in concept)
+                domain_score = keyword_matches / len(key_concepts)
                 
                 # Combinar puntuaciones
                 final_score = (base_score + domain_score) / 2.0
@@ -265,6 +315,9 @@ class ConceptExtractor:
             Diccionario con el grafo de conocimiento
         """
         try:
+            # El texto se limpia una sola vez y se comparte entre extractores
+            text = self._clean_text(text)
+            
             # 1. Extraer conceptos por dominio con puntuación
             domain_concepts = self._extract_domain_specific_concepts(text, domains)
             
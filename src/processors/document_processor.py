@@ -4,6 +4,8 @@ Procesador de documentos (PDF, XLS, DOC, TXT).
 from typing import Dict, Any, Optional
 import logging
 from pathlib import Path
+import aiofiles
+import aiofiles.os
 import PyPDF2
 import docx
 import pandas as pd
@@ -14,7 +16,16 @@ logger = logging.getLogger(__name__)
 class DocumentProcessor(BaseProcessor):
     """Procesa documentos en varios formatos."""
     
-    SUPPORTED_EXTENSIONS = {'.pdf', '.xlsx', '.xls', '.docx', '.doc', '.txt'}
+    # Extensión -> método que la procesa, resuelto con un solo lookup
+    _EXTENSION_HANDLERS = {
+        '.pdf': '_process_pdf',
+        '.xlsx': '_process_excel',
+        '.xls': '_process_excel',
+        '.docx': '_process_word',
+        '.doc': '_process_word',
+        '.txt': '_process_text',
+    }
+    SUPPORTED_EXTENSIONS = set(_EXTENSION_HANDLERS)
     
     async def validate_source(self, source: str) -> bool:
         """Valida si el archivo es compatible."""
@@ -26,16 +37,11 @@ class DocumentProcessor(BaseProcessor):
             file_path = Path(source)
             extension = file_path.suffix.lower()
             
-            if extension in {'.pdf'}:
-                return await self._process_pdf(file_path)
-            elif extension in {'.xlsx', '.xls'}:
-                return await self._process_excel(file_path)
-            elif extension in {'.docx', '.doc'}:
-                return await self._process_word(file_path)
-            elif extension in {'.txt'}:
-                return await self._process_text(file_path)
-            else:
+            handler_name = self._EXTENSION_HANDLERS.get(extension)
+            if handler_name is None:
                 raise ValueError(f"Formato no soportado: {extension}")
+            
+            return await getattr(self, handler_name)(file_path)
                 
         except Exception as e:
             logger.error(f"Error procesando documento {source}: {str(e)}")
@@ -59,9 +65,7 @@ class DocumentProcessor(BaseProcessor):
         """Procesa archivo PDF."""
         with open(file_path, 'rb') as file:
             reader = PyPDF2.PdfReader(file)
-            text = ""
-            for page in reader.pages:
-                text += page.extract_text()
+            text = "".join(page.extract_text() for page in reader.pages)
             
             return {
                 "type": "pdf",
@@ -105,14 +109,16 @@ class DocumentProcessor(BaseProcessor):
     
     async def _process_text(self, file_path: Path) -> Dict[str, Any]:
         """Procesa archivo de texto."""
-        with open(file_path, 'r', encoding='utf-8') as file:
-            text = file.read()
+        # Lectura asíncrona para no bloquear el event loop
+        async with aiofiles.open(file_path, 'r', encoding='utf-8') as file:
+            text = await file.read()
+        stat = await aiofiles.os.stat(file_path)
             
         return {
             "type": "text",
             "text": text,
             "metadata": {
-                "size": file_path.stat().st_size,
+                "size": stat.st_size,
                 "title": file_path.stem
             }
         }
@@ -2,7 +2,7 @@
 Categorizador de dominios de conocimiento usando técnicas ligeras y eficientes.
 """
 
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Set, Tuple
 import logging
 import json
 import os
@@ -19,6 +19,34 @@ class DomainCategorizer:
         """Inicializa el categorizador con la jerarquía de dominios."""
         self.domain_hierarchy = self._load_domain_hierarchy()
         
+        # Keywords de cada dominio en minúsculas, calculadas una sola vez
+        self._domain_keywords = {
+            domain: tuple(kw.lower() for kw in data["keywords"])
+            for domain, data in self.domain_hierarchy.items()
+        }
+        
+        # Patrones de cada dominio compilados una sola vez al cargar la jerarquía
+        self._compiled_patterns = {
+            domain: [re.compile(pattern) for pattern in data["patterns"]]
+            for domain, data in self.domain_hierarchy.items()
+        }
+        
+        # Máximos posibles de keywords y de matches de patrones por dominio
+        # (asumimos máximo 5 matches por patrón), usados para normalizar
+        self._score_limits = {
+            domain: (len(data["keywords"]), len(data["patterns"]) * 5)
+            for domain, data in self.domain_hierarchy.items()
+        }
+        
+        # Frases de búsqueda de cada sub-dominio, calculadas una sola vez
+        self._sub_domain_phrases = {
+            domain: tuple(
+                (sub_domain, sub_domain.replace("_", " "))
+                for sub_domain in data["sub_domains"]
+            )
+            for domain, data in self.domain_hierarchy.items()
+        }
+        
     def _load_domain_hierarchy(self) -> Dict[str, Dict]:
         """
         Carga la jerarquía de dominios desde un archivo JSON si existe,
@@ -60,88 +88,109 @@ class DomainCategorizer:
         # TODO: Cargar desde archivo JSON si existe
         return default_hierarchy
     
-    def _calculate_domain_score(self, text: str, domain: str) -> float:
+    def _find_keywords(self, text_lower: str, domain: str) -> Set[str]:
+        """
+        Encuentra las keywords del dominio presentes en el texto.
+        
+        Args:
+            text_lower: Texto a analizar, en minúsculas
+            domain: Nombre del dominio
+            
+        Returns:
+            Conjunto de keywords encontradas
+        """
+        return {kw for kw in self._domain_keywords[domain] if kw in text_lower}
+    
+    def _match_domain(self, text_lower: str, domain: str) -> Tuple[Set[str], List[List]]:
+        """
+        Busca keywords y patrones del dominio en el texto una sola vez,
+        para reutilizar el resultado en el score y en los conceptos clave.
+        
+        Args:
+            text_lower: Texto a analizar, en minúsculas
+            domain: Nombre del dominio
+            
+        Returns:
+            Tupla (keywords encontradas, matches de cada patrón)
+        """
+        keywords = self._find_keywords(text_lower, domain)
+        pattern_matches = [
+            pattern.findall(text_lower)
+            for pattern in self._compiled_patterns[domain]
+        ]
+        return keywords, pattern_matches
+    
+    def _calculate_domain_score(self, domain: str, keywords: Set[str],
+                                pattern_matches: List[List]) -> float:
         """
         Calcula un score para un dominio basado en keywords y patrones.
         
         Args:
-            text: Texto a analizar
             domain: Nombre del dominio
+            keywords: Keywords del dominio encontradas en el texto
+            pattern_matches: Matches de cada patrón del dominio
             
         Returns:
             Score entre 0 y 1
         """
-        domain_data = self.domain_hierarchy[domain]
-        text_lower = text.lower()
-        
         # Contar keywords
-        keyword_count = sum(1 for kw in domain_data["keywords"] 
-                          if kw.lower() in text_lower)
+        keyword_count = len(keywords)
         
         # Contar matches de patrones
-        pattern_matches = sum(len(re.findall(pattern, text_lower)) 
-                            for pattern in domain_data["patterns"])
+        pattern_count = sum(len(matches) for matches in pattern_matches)
         
         # Normalizar scores
-        max_possible_keywords = len(domain_data["keywords"])
-        max_possible_patterns = len(domain_data["patterns"]) * 5  # Asumimos máximo 5 matches por patrón
+        max_possible_keywords, max_possible_patterns = self._score_limits[domain]
         
         keyword_score = keyword_count / max_possible_keywords
-        pattern_score = min(1.0, pattern_matches / max_possible_patterns)
+        pattern_score = min(1.0, pattern_count / max_possible_patterns)
         
         # Combinar scores (damos más peso a los patrones)
         final_score = (0.4 * keyword_score + 0.6 * pattern_score)
         
         return final_score
     
-    def _extract_key_concepts(self, text: str, domain: str) -> List[str]:
+    def _extract_key_concepts(self, keywords: Set[str],
+                              pattern_matches: List[List]) -> List[str]:
         """
         Extrae conceptos clave específicos del dominio.
         
         Args:
-            text: Texto a analizar
-            domain: Nombre del dominio
+            keywords: Keywords del dominio encontradas en el texto
+            pattern_matches: Matches de cada patrón del dominio
             
         Returns:
             Lista de conceptos clave encontrados
         """
-        domain_data = self.domain_hierarchy[domain]
-        text_lower = text.lower()
-        
-        # Encontrar keywords presentes
-        concepts = [kw for kw in domain_data["keywords"] 
-                   if kw.lower() in text_lower]
+        # Keywords presentes
+        concepts = list(keywords)
         
-        # Encontrar matches únicos de patrones
-        for pattern in domain_data["patterns"]:
-            matches = re.findall(pattern, text_lower)
+        # Matches únicos de patrones
+        for matches in pattern_matches:
             concepts.extend([m[0] if isinstance(m, tuple) else m 
                            for m in matches])
         
         # Eliminar duplicados y ordenar
         return sorted(list(set(concepts)))
     
-    def _detect_sub_domains(self, text: str, domain: str) -> List[str]:
+    def _detect_sub_domains(self, text_lower: str, domain: str) -> List[str]:
         """
         Detecta sub-dominios relevantes.
         
         Args:
-            text: Texto a analizar
+            text_lower: Texto a analizar, en minúsculas
             domain: Nombre del dominio principal
             
         Returns:
             Lista de sub-dominios detectados
         """
-        domain_data = self.domain_hierarchy[domain]
-        detected = []
-        
-        for sub_domain in domain_data["sub_domains"]:
-            # Por ahora usamos un enfoque simple basado en keywords
-            # TODO: Mejorar con patrones específicos para sub-dominios
-            if sub_domain.replace("_", " ") in text.lower():
-                detected.append(sub_domain)
-        
-        return detected
+        # Por ahora usamos un enfoque simple basado en keywords
+        # TODO: Mejorar con patrones específicos para sub-dominios
+        return [
+            sub_domain
+            for sub_domain, phrase in self._sub_domain_phrases[domain]
+            if phrase in text_lower
+        ]
     
     def categorize(self, text: str) -> List[KnowledgeDomain]:
         """
@@ -156,10 +205,17 @@ class DomainCategorizer:
         try:
             detected_domains = []
             
+            # Buscar keywords y patrones de cada dominio una sola vez
+            text_lower = text.lower()
+            domain_matches = {
+                domain: self._match_domain(text_lower, domain)
+                for domain in self.domain_hierarchy.keys()
+            }
+            
             # Calcular scores para cada dominio
             domain_scores = {
-                domain: self._calculate_domain_score(text, domain)
-                for domain in self.domain_hierarchy.keys()
+                domain: self._calculate_domain_score(domain, *matches)
+                for domain, matches in domain_matches.items()
             }
             
             # Ordenar dominios por score
@@ -171,8 +227,8 @@ class DomainCategorizer:
             for domain_name, score in sorted_domains:
                 if score > 0.3:  # Umbral mínimo de confianza
                     # Extraer información adicional
-                    key_concepts = self._extract_key_concepts(text, domain_name)
-                    sub_domains = self._detect_sub_domains(text, domain_name)
+                    key_concepts = self._extract_key_concepts(*domain_matches[domain_name])
+                    sub_domains = self._detect_sub_domains(text_lower, domain_name)
                     
                     # Crear objeto de dominio
                     domain = KnowledgeDomain(
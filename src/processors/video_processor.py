@@ -3,7 +3,6 @@ Procesador de video mejorado con análisis visual y semántico.
 """
 
 import cv2
-import numpy as np
 from typing import List, Dict, Optional
 import torch
 from transformers import AutoFeatureExtractor, AutoModelForObjectDetection
@@ -110,22 +109,24 @@ class EnhancedVideoProcessor:
                 threshold=0.7
             )[0]
             
-            detections = []
-            for score, label, box in zip(
-                results["scores"],
-                results["labels"],
-                results["boxes"]
-            ):
-                detections.append({
-                    "label": self.model.config.id2label[label.item()],
-                    "confidence": score.item(),
-                    "box": box.tolist()
-                })
-                
-            return detections
+            # Convertir cada tensor a lista de una sola vez en lugar de
+            # extraer escalares detección por detección
+            id2label = self.model.config.id2label
+            return [
+                {
+                    "label": id2label[label],
+                    "confidence": score,
+                    "box": box
+                }
+                for score, label, box in zip(
+                    results["scores"].tolist(),
+                    results["labels"].tolist(),
+                    results["boxes"].tolist()
+                )
+            ]
             
         except Exception as e:
-            logger.error(f"Error detectando objetos en {frame_path}: {e}")
+            logger.error("Error detectando objetos en %s: %s", frame_path, e)
             return []
             
     def _analyze_scene(self, frames: List[VideoFrame], window_size: int = 5) -> List[bool]:
@@ -145,21 +146,25 @@ class EnhancedVideoProcessor:
             return scene_changes
             
         try:
+            # Cada frame se lee de disco una sola vez y se reutiliza
+            # como frame anterior en la siguiente iteración
+            previous = cv2.imread(frames[window_size - 1].image_path)
             for i in range(window_size, len(frames)):
-                # Cargar frames
                 current = cv2.imread(frames[i].image_path)
-                previous = cv2.imread(frames[i-1].image_path)
                 
                 if current is None or previous is None:
+                    previous = current
                     continue
                     
-                # Calcular diferencia
-                diff = cv2.absdiff(current, previous)
-                diff_score = np.mean(diff)
+                # Diferencia media absoluta: la norma L1 se calcula en una
+                # sola pasada sin materializar la imagen de diferencias
+                diff_score = cv2.norm(current, previous, cv2.NORM_L1) / current.size
                 
                 # Si la diferencia es mayor al umbral, marcar como cambio de escena
                 if diff_score > 30:  # Umbral ajustable
                     scene_changes[i] = True
+                
+                previous = current
                     
         except Exception as e:
             logger.error(f"Error analizando escenas: {e}")
@@ -197,8 +202,8 @@ class EnhancedVideoProcessor:
         knowledge_graph = self.concept_extractor.extract_knowledge_graph(transcript, domains)
         
         # Calcular score de importancia basado en conceptos y objetos detectados
-        concept_score = max([d.confidence for d in domains]) if domains else 0.0
-        object_score = max([f.relevance_score for f in fragment_frames]) if fragment_frames else 0.0
+        concept_score = max((d.confidence for d in domains), default=0.0)
+        object_score = max((f.relevance_score for f in fragment_frames), default=0.0)
         importance_score = (concept_score + object_score) / 2
         
         return VideoFragment(
@@ -238,7 +243,7 @@ class EnhancedVideoProcessor:
             for frame in frames:
                 objects = self._detect_objects(frame.image_path)
                 frame.objects = [obj["label"] for obj in objects]
-                frame.relevance_score = max([obj["confidence"] for obj in objects]) if objects else 0.0
+                frame.relevance_score = max((obj["confidence"] for obj in objects), default=0.0)
             
             # 3. Analizar cambios de escena
             logger.info("Analizando escenas...")
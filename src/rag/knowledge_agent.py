@@ -76,14 +76,18 @@ class KnowledgeAgent:
         """Aprende de múltiples URLs."""
         pages = await self.crawler.scrape_multiple(urls)
         
-        # Almacenar todos los chunks
-        for page in pages:
-            await self.vector_store.add_documents([
-                chunk for chunk in page.chunks
-            ])
+        # Almacenar todos los chunks en un solo lote: el índice se
+        # guarda en disco una vez en lugar de una vez por página
+        chunks = [chunk for page in pages for chunk in page.chunks]
+        if chunks:
+            await self.vector_store.add_documents(chunks)
         
         return pages
     
+    async def close(self) -> None:
+        """Libera las conexiones HTTP del crawler."""
+        await self.crawler.close()
+    
     async def query_knowledge(
         self,
         query: KnowledgeQuery,
@@ -1,5 +1,7 @@
 from typing import List, Dict, Any, Optional, Set
 from datetime import datetime
+from collections import Counter
+from bisect import bisect_right
 import asyncio
 from pydantic import BaseModel, Field
 from langchain.chat_models import ChatOpenAI
@@ -9,6 +11,14 @@ from ..embeddings.vector_store import VectorStore, VectorDocument
 from ..scrapers.providers.advanced_crawler import AdvancedCrawler
 from ..scrapers.providers.youtube_scraper import YouTubeScraper
 
+# Umbrales de confianza y nivel asignado a cada tramo
+CONFIDENCE_THRESHOLDS = (0.5, 0.8)
+CONFIDENCE_LEVELS = ("low", "medium", "high")
+
+def _confidence_level(confidence: float) -> str:
+    """Nivel de confianza (low/medium/high) correspondiente a un valor."""
+    return CONFIDENCE_LEVELS[bisect_right(CONFIDENCE_THRESHOLDS, confidence)]
+
 class KnowledgeNode(BaseModel):
     """Modelo para un nodo de conocimiento."""
     id: str
@@ -43,15 +53,22 @@ class KnowledgeConsolidator:
         self,
         model_name: str = "gpt-4",
         temperature: float = 0.7,
-        vector_store: Optional[VectorStore] = None
+        vector_store: Optional[VectorStore] = None,
+        max_concurrency: int = 4
     ):
         """Inicializa el consolidador de conocimiento."""
+        self.max_concurrency = max_concurrency
         self.llm = ChatOpenAI(
             model_name=model_name,
             temperature=temperature
         )
         self.vector_store = vector_store or VectorStore("consolidated_knowledge")
         self.knowledge_graph = KnowledgeGraph()
+        # Estadísticas acumuladas, actualizadas al agregar o revalidar nodos
+        self._total_confidence = 0.0
+        self._confidence_levels: Counter = Counter()
+        self._source_types: Counter = Counter()
+        self._last_validation: Optional[datetime] = None
         self.crawler = AdvancedCrawler()
         self.youtube_scraper = YouTubeScraper()
         
@@ -129,22 +146,25 @@ class KnowledgeConsolidator:
         })
         
         # Crear nodo de conocimiento
+        now = datetime.now()
         node = KnowledgeNode(
             id=f"node_{len(self.knowledge_graph.nodes)}",
             content=content,
             source_type=source_type,
             source_url=source_url,
             confidence=float(validation_result.get("confidence", 0.5)),
-            last_validated=datetime.now(),
+            last_validated=now,
             metadata=metadata or {},
             validation_history=[{
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": now.isoformat(),
                 "validation_result": validation_result
             }]
         )
         
         # Agregar al grafo
         self.knowledge_graph.nodes[node.id] = node
+        self._source_types[source_type] += 1
+        self._record_validation(node, None)
         
         # Conectar con nodos relacionados
         for doc in related_docs:
@@ -164,7 +184,7 @@ class KnowledgeConsolidator:
                     "node_id": node.id,
                     "source_type": source_type,
                     "source_url": source_url,
-                    **metadata or {}
+                    **(metadata or {})
                 }
             )
         ])
@@ -186,14 +206,15 @@ class KnowledgeConsolidator:
         Returns:
             Diccionario con conclusiones y metadatos
         """
-        # Filtrar nodos relevantes
+        # Filtrar nodos relevantes (el tema se normaliza una sola vez)
+        topic_lower = topic.lower() if topic else None
         relevant_nodes = {
             node_id: node
             for node_id, node in self.knowledge_graph.nodes.items()
             if node.confidence >= min_confidence and (
-                not topic or
-                topic.lower() in node.content.lower() or
-                any(topic.lower() in meta_value.lower()
+                topic_lower is None or
+                topic_lower in node.content.lower() or
+                any(topic_lower in meta_value.lower()
                     for meta_value in node.metadata.values()
                     if isinstance(meta_value, str))
             )
@@ -216,8 +237,9 @@ class KnowledgeConsolidator:
         })
         
         # Actualizar metadatos del grafo
+        now = datetime.now().isoformat()
         self.knowledge_graph.metadata.update({
-            "last_consolidation": datetime.now().isoformat(),
+            "last_consolidation": now,
             "total_nodes": len(self.knowledge_graph.nodes),
             "consolidated_nodes": len(relevant_nodes),
             "average_confidence": sum(
@@ -230,7 +252,7 @@ class KnowledgeConsolidator:
             "synthesis": synthesis,
             "metadata": self.knowledge_graph.metadata,
             "consolidated_nodes": len(relevant_nodes),
-            "timestamp": datetime.now().isoformat()
+            "timestamp": now
         }
     
     async def validate_and_update(
@@ -252,40 +274,17 @@ class KnowledgeConsolidator:
             else list(self.knowledge_graph.nodes.values())
         )
         
-        results = []
-        for node in nodes_to_validate:
-            # Obtener información relacionada actualizada
-            related_docs = await self.vector_store.search(
-                node.content,
-                k=5,
-                threshold=0.7
-            )
-            
-            # Revalidar
-            validation_result = await self.validation_chain.arun({
-                "content": node.content,
-                "source": node.source_url,
-                "source_type": node.source_type,
-                "related_info": "\n".join(
-                    f"- {doc['content']}" for doc in related_docs
-                )
-            })
-            
-            # Actualizar nodo
-            node.confidence = float(validation_result.get("confidence", node.confidence))
-            node.last_validated = datetime.now()
-            node.validation_history.append({
-                "timestamp": datetime.now().isoformat(),
-                "validation_result": validation_result
-            })
-            
-            results.append({
-                "node_id": node.id,
-                "old_confidence": node.validation_history[-2]["validation_result"].get("confidence")
-                if len(node.validation_history) > 1 else None,
-                "new_confidence": node.confidence,
-                "validation_result": validation_result
-            })
+        # Los nodos son independientes entre sí: revalidarlos en paralelo,
+        # limitando las llamadas simultáneas al LLM y al vector store
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        
+        async def _revalidate_bounded(node: KnowledgeNode) -> Dict[str, Any]:
+            async with semaphore:
+                return await self._revalidate_node(node)
+        
+        results = await asyncio.gather(
+            *(_revalidate_bounded(node) for node in nodes_to_validate)
+        )
         
         return {
             "status": "success",
@@ -294,25 +293,76 @@ class KnowledgeConsolidator:
             "timestamp": datetime.now().isoformat()
         }
     
+    async def _revalidate_node(self, node: KnowledgeNode) -> Dict[str, Any]:
+        """Revalida un nodo y retorna el resultado de la validación."""
+        # Obtener información relacionada actualizada
+        related_docs = await self.vector_store.search(
+            node.content,
+            k=5,
+            threshold=0.7
+        )
+        
+        # Revalidar
+        validation_result = await self.validation_chain.arun({
+            "content": node.content,
+            "source": node.source_url,
+            "source_type": node.source_type,
+            "related_info": "\n".join(
+                f"- {doc['content']}" for doc in related_docs
+            )
+        })
+        
+        # Actualizar nodo
+        old_confidence = node.confidence
+        node.confidence = float(validation_result.get("confidence", node.confidence))
+        node.last_validated = datetime.now()
+        self._record_validation(node, old_confidence)
+        node.validation_history.append({
+            "timestamp": node.last_validated.isoformat(),
+            "validation_result": validation_result
+        })
+        
+        return {
+            "node_id": node.id,
+            "old_confidence": node.validation_history[-2]["validation_result"].get("confidence")
+            if len(node.validation_history) > 1 else None,
+            "new_confidence": node.confidence,
+            "validation_result": validation_result
+        }
+    
+    def _record_validation(self, node: KnowledgeNode,
+                           old_confidence: Optional[float]) -> None:
+        """
+        Actualiza las estadísticas acumuladas tras validar un nodo.
+        
+        Args:
+            node: Nodo recién validado
+            old_confidence: Confianza previa del nodo, o None si es nuevo
+        """
+        if old_confidence is not None:
+            self._total_confidence -= old_confidence
+            self._confidence_levels[_confidence_level(old_confidence)] -= 1
+        self._total_confidence += node.confidence
+        self._confidence_levels[_confidence_level(node.confidence)] += 1
+        if self._last_validation is None or node.last_validated > self._last_validation:
+            self._last_validation = node.last_validated
+    
     def get_knowledge_stats(self) -> Dict[str, Any]:
         """Obtiene estadísticas del conocimiento almacenado."""
-        nodes = self.knowledge_graph.nodes.values()
+        total_nodes = len(self.knowledge_graph.nodes)
         return {
-            "total_nodes": len(nodes),
-            "average_confidence": sum(n.confidence for n in nodes) / len(nodes)
-            if nodes else 0,
-            "source_types": {
-                source_type: len([n for n in nodes if n.source_type == source_type])
-                for source_type in {n.source_type for n in nodes}
-            },
+            "total_nodes": total_nodes,
+            "average_confidence": self._total_confidence / total_nodes
+            if total_nodes else 0,
+            "source_types": dict(self._source_types),
             "nodes_by_confidence": {
-                "high": len([n for n in nodes if n.confidence >= 0.8]),
-                "medium": len([n for n in nodes if 0.5 <= n.confidence < 0.8]),
-                "low": len([n for n in nodes if n.confidence < 0.5])
+                level: self._confidence_levels[level]
+                for level in reversed(CONFIDENCE_LEVELS)
             },
-            "last_validation": max(
-                (n.last_validated for n in nodes),
-                default=None
-            ),
+            "last_validation": self._last_validation,
             "vector_store": self.vector_store.get_collection_stats()
         }
+    
+    async def close(self) -> None:
+        """Libera las conexiones HTTP de los scrapers."""
+        await asyncio.gather(self.crawler.close(), self.youtube_scraper.close())
@@ -1,6 +1,13 @@
 from abc import ABC, abstractmethod
 from typing import Any, Dict, List, Optional, Union
+from urllib.parse import urlparse
+import asyncio
+import logging
+import aiohttp
 from pydantic import BaseModel
+from .utils.rate_limiter import RateLimiter
+
+logger = logging.getLogger(__name__)
 
 class ScrapingConfig(BaseModel):
     """Configuration for scraping operations."""
@@ -12,6 +19,9 @@ class ScrapingConfig(BaseModel):
     proxy: Optional[str] = None
     verify_ssl: bool = True
     rate_limit: float = 1.0  # seconds between requests
+    cache_ttl: float = 600.0  # seconds to reuse a scraped page (0 disables)
+    cache_max_entries: int = 512  # least recently used pages are evicted beyond this
+    max_concurrency: int = 5  # simultaneous requests in scrape_multiple
 
 class ScrapedData(BaseModel):
     """Base model for scraped data."""
@@ -25,6 +35,82 @@ class BaseScraper(ABC):
     
     def __init__(self, config: Optional[ScrapingConfig] = None):
         self.config = config or ScrapingConfig()
+        self._http_session: Optional[aiohttp.ClientSession] = None
+        self._http_session_loop: Optional[asyncio.AbstractEventLoop] = None
+        self.rate_limiter = (
+            RateLimiter(requests_per_second=1.0 / self.config.rate_limit)
+            if self.config.rate_limit > 0 else None
+        )
+    
+    def _session(self) -> aiohttp.ClientSession:
+        """
+        Return the shared HTTP session, creating it on first use.
+        
+        A session is bound to the event loop it was created on, so a new one
+        is created when the scraper is used from a different loop.
+        """
+        loop = asyncio.get_running_loop()
+        if (
+            self._http_session is None
+            or self._http_session.closed
+            or self._http_session_loop is not loop
+        ):
+            self._http_session = aiohttp.ClientSession()
+            self._http_session_loop = loop
+        return self._http_session
+    
+    async def _scrape_many(self, urls: List[str]) -> List[ScrapedData]:
+        """
+        Validate and scrape several URLs concurrently.
+        
+        At most config.max_concurrency URLs are processed at once, and both
+        the validation and the scraping request to a domain are spaced by
+        config.rate_limit. URLs that fail validation or scraping are skipped
+        without aborting the batch; scraping errors are logged.
+        """
+        semaphore = asyncio.Semaphore(self.config.max_concurrency)
+        
+        async def scrape_one(url: str) -> Optional[ScrapedData]:
+            domain = urlparse(url).netloc
+            async with semaphore:
+                if self.rate_limiter:
+                    await self.rate_limiter.acquire(domain)
+                if not await self.validate_url(url):
+                    return None
+                if self.rate_limiter:
+                    await self.rate_limiter.acquire(domain)
+                return await self.scrape(url)
+        
+        results = await asyncio.gather(
+            *(scrape_one(url) for url in urls),
+            return_exceptions=True
+        )
+        
+        scraped = []
+        for url, result in zip(urls, results):
+            if isinstance(result, BaseException):
+                logger.error("Error scraping %s: %s", url, result)
+            elif isinstance(result, ScrapedData):
+                scraped.append(result)
+        return scraped
+    
+    async def close(self) -> None:
+        """Close the shared HTTP session."""
+        # A session from a loop that is gone can no longer be closed cleanly
+        if (
+            self._http_session is not None
+            and not self._http_session.closed
+            and self._http_session_loop is asyncio.get_running_loop()
+        ):
+            await self._http_session.close()
+        self._http_session = None
+        self._http_session_loop = None
+    
+    async def __aenter__(self) -> "BaseScraper":
+        return self
+    
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
         
     @abstractmethod
     async def scrape(self, url: str) -> ScrapedData:
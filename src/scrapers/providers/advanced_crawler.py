@@ -1,11 +1,19 @@
 from typing import Any, Dict, List, Optional
-import asyncio
 from bs4 import BeautifulSoup
 from langchain.text_splitter import RecursiveCharacterTextSplitter
 from pydantic import BaseModel
 from datetime import datetime
 from ..base_scraper import BaseScraper, ScrapedData, ScrapingConfig
 
+# Formato markdown (prefijo, sufijo) de cada bloque extraído
+BLOCK_FORMATS = {
+    **{f"h{level}": ("#" * level + " ", "\n") for level in range(1, 7)},
+    "li": ("- ", "\n"),
+    "p": ("", "\n\n"),
+    "pre": ("", "\n\n"),
+}
+BLOCK_TAGS = ['p', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'li', 'pre']
+
 class CrawledChunk(BaseModel):
     """Modelo para un chunk de contenido procesado."""
     content: str
@@ -45,27 +53,25 @@ class AdvancedCrawler(BaseScraper):
         
         # Extraer texto manteniendo estructura
         lines = []
-        for elem in soup.find_all(['p', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'li', 'pre']):
-            if elem.name.startswith('h'):
-                level = int(elem.name[1])
-                lines.append(f"{'#' * level} {elem.get_text().strip()}\n")
-            elif elem.name == 'li':
-                lines.append(f"- {elem.get_text().strip()}\n")
-            else:
-                lines.append(f"{elem.get_text().strip()}\n\n")
+        for elem in soup.find_all(BLOCK_TAGS):
+            prefix, suffix = BLOCK_FORMATS[elem.name]
+            lines.append(f"{prefix}{elem.get_text().strip()}{suffix}")
         
         return "".join(lines)
     
     def _chunk_content(self, content: str) -> List[CrawledChunk]:
         """Divide el contenido en chunks inteligentes."""
         chunks = self.text_splitter.split_text(content)
+        # Todos los chunks de una página comparten el mismo timestamp
+        timestamp = datetime.now().isoformat()
+        total_chunks = len(chunks)
         return [
             CrawledChunk(
                 content=chunk,
                 metadata={
                     "chunk_index": i,
-                    "total_chunks": len(chunks),
-                    "timestamp": datetime.now().isoformat()
+                    "total_chunks": total_chunks,
+                    "timestamp": timestamp
                 }
             )
             for i, chunk in enumerate(chunks)
@@ -90,66 +96,59 @@ class AdvancedCrawler(BaseScraper):
     async def scrape(self, url: str) -> CrawledPage:
         """Realiza el crawling de una página con procesamiento avanzado."""
         try:
-            async with self._session() as session:
-                async with session.get(
-                    url,
-                    headers=self.config.headers,
-                    proxy=self.config.proxy,
-                    ssl=self.config.verify_ssl,
-                    timeout=self.config.timeout
-                ) as response:
-                    html = await response.text()
-                    soup = BeautifulSoup(html, 'html.parser')
-                    
-                    # Extraer título y metadatos
-                    title = soup.title.string if soup.title else ""
-                    metadata = await self._extract_metadata(soup)
-                    
-                    # Procesar contenido
-                    content = self._extract_text_with_context(soup)
-                    chunks = self._chunk_content(content)
-                    
-                    # Generar resumen (esto podría mejorarse usando LLM)
-                    summary = metadata.get('description', content[:200] + "...")
-                    
-                    return CrawledPage(
-                        url=url,
-                        timestamp=datetime.now().isoformat(),
-                        title=title,
-                        summary=summary,
-                        chunks=chunks,
-                        content=content,
-                        metadata=metadata
-                    )
+            session = self._session()
+            async with session.get(
+                url,
+                headers=self.config.headers,
+                proxy=self.config.proxy,
+                ssl=self.config.verify_ssl,
+                timeout=self.config.timeout
+            ) as response:
+                html = await response.text()
+                soup = BeautifulSoup(html, 'html.parser')
+                
+                # Extraer título y metadatos
+                title = soup.title.string if soup.title else ""
+                metadata = await self._extract_metadata(soup)
+                
+                # Procesar contenido
+                content = self._extract_text_with_context(soup)
+                chunks = self._chunk_content(content)
+                
+                # Generar resumen (esto podría mejorarse usando LLM)
+                summary = metadata.get('description', content[:200] + "...")
+                
+                return CrawledPage(
+                    url=url,
+                    timestamp=datetime.now().isoformat(),
+                    title=title,
+                    summary=summary,
+                    chunks=chunks,
+                    content=content,
+                    metadata=metadata
+                )
         except Exception as e:
             raise Exception(f"Error crawling page: {str(e)}")
     
     async def scrape_multiple(self, urls: List[str]) -> List[CrawledPage]:
         """Realiza el crawling de múltiples páginas."""
-        tasks = []
-        async with self._session() as session:
-            for url in urls:
-                if await self.validate_url(url):
-                    tasks.append(self.scrape(url))
-                await asyncio.sleep(self.config.rate_limit)
-            
-            return await asyncio.gather(*tasks)
+        return await self._scrape_many(urls)
     
     async def validate_url(self, url: str) -> bool:
         """Valida si una URL es accesible y contiene contenido HTML."""
         try:
-            async with self._session() as session:
-                async with session.get(
-                    url,
-                    headers=self.config.headers,
-                    proxy=self.config.proxy,
-                    ssl=self.config.verify_ssl,
-                    timeout=self.config.timeout
-                ) as response:
-                    return (
-                        response.status == 200 and
-                        'text/html' in response.headers.get('content-type', '').lower()
-                    )
+            session = self._session()
+            async with session.get(
+                url,
+                headers=self.config.headers,
+                proxy=self.config.proxy,
+                ssl=self.config.verify_ssl,
+                timeout=self.config.timeout
+            ) as response:
+                return (
+                    response.status == 200 and
+                    'text/html' in response.headers.get('content-type', '').lower()
+                )
         except:
             return False
     
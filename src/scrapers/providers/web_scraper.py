@@ -1,10 +1,11 @@
 import asyncio
+import time
 from datetime import datetime
-from typing import Any, Dict, List, Optional
-import aiohttp
+from typing import Any, Dict, List, Optional, Tuple
 from bs4 import BeautifulSoup
 from urllib.parse import urljoin, urlparse
 from ..base_scraper import BaseScraper, ScrapedData, ScrapingConfig
+from ...utils import LRUCache
 
 class WebData(ScrapedData):
     """Model for web-specific scraped data."""
@@ -19,92 +20,128 @@ class WebScraper(BaseScraper):
     
     def __init__(self, config: Optional[ScrapingConfig] = None):
         super().__init__(config)
+        # url -> (monotonic time stored, scraped page), kept in LRU order
+        self._cache: LRUCache[str, Tuple[float, WebData]] = LRUCache(
+            self.config.cache_max_entries
+        )
+        # url -> fetch currently in progress, shared by concurrent callers
+        self._inflight: Dict[str, "asyncio.Task[WebData]"] = {}
         
     async def validate_url(self, url: str) -> bool:
         """Validate if URL is accessible and returns HTML content."""
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    url,
-                    headers=self.config.headers,
-                    proxy=self.config.proxy,
-                    ssl=self.config.verify_ssl,
-                    timeout=self.config.timeout
-                ) as response:
-                    return (
-                        response.status == 200 and
-                        'text/html' in response.headers.get('content-type', '').lower()
-                    )
+            session = self._session()
+            async with session.get(
+                url,
+                headers=self.config.headers,
+                proxy=self.config.proxy,
+                ssl=self.config.verify_ssl,
+                timeout=self.config.timeout
+            ) as response:
+                return (
+                    response.status == 200 and
+                    'text/html' in response.headers.get('content-type', '').lower()
+                )
         except:
             return False
     
     async def scrape(self, url: str) -> WebData:
-        """Scrape data from a web page."""
+        """Scrape data from a web page, reusing recent results for the same URL."""
+        cached = self._cache.get(url)
+        if cached is not None:
+            stored_at, data = cached
+            if time.monotonic() - stored_at < self.config.cache_ttl:
+                return data
+            self._cache.pop(url)
+        
+        task = self._inflight.get(url)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch_and_cache(url))
+            self._inflight[url] = task
+            task.add_done_callback(lambda done: self._fetch_done(url, done))
+        
+        return await asyncio.shield(task)
+    
+    def _fetch_done(self, url: str, task: "asyncio.Task[WebData]") -> None:
+        """Forget a finished in-flight fetch and retrieve its error, if any."""
+        self._inflight.pop(url, None)
+        # Mark the exception as retrieved even if no caller is left to await
+        # it, so asyncio does not report it as never retrieved
+        if not task.cancelled():
+            task.exception()
+    
+    async def _fetch_and_cache(self, url: str) -> WebData:
+        """
+        Fetch a page and cache it once, stamped with the time the fetch finished.
+        
+        Runs as the shared in-flight task, so the page is cached even if every
+        caller waiting on it has been cancelled.
+        """
+        data = await self._fetch(url)
+        if self.config.cache_ttl > 0:
+            self._cache.put(url, (time.monotonic(), data))
+        return data
+    
+    async def _fetch(self, url: str) -> WebData:
+        """Download and parse a web page."""
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    url,
-                    headers=self.config.headers,
-                    proxy=self.config.proxy,
-                    ssl=self.config.verify_ssl,
-                    timeout=self.config.timeout
-                ) as response:
-                    if response.status != 200:
-                        raise Exception(f"HTTP {response.status}: {response.reason}")
-                    
-                    html_content = await response.text()
-                    soup = BeautifulSoup(html_content, 'html.parser')
-                    
-                    # Extract title
-                    title = soup.title.string if soup.title else ""
-                    
-                    # Extract text content
-                    for script in soup(["script", "style"]):
-                        script.decompose()
-                    text_content = soup.get_text(separator='\n', strip=True)
-                    
-                    # Extract links
-                    base_url = f"{urlparse(url).scheme}://{urlparse(url).netloc}"
-                    links = [
-                        urljoin(base_url, a.get('href'))
-                        for a in soup.find_all('a', href=True)
-                    ]
-                    
-                    # Extract images
-                    images = [
-                        urljoin(base_url, img.get('src'))
-                        for img in soup.find_all('img', src=True)
-                    ]
-                    
-                    return WebData(
-                        url=url,
-                        timestamp=datetime.now().isoformat(),
-                        content=html_content,
-                        title=title,
-                        text_content=text_content,
-                        html_content=html_content,
-                        links=links,
-                        images=images,
-                        metadata={
-                            "headers": dict(response.headers),
-                            "content_type": response.headers.get('content-type'),
-                            "content_length": len(html_content),
-                            "status_code": response.status
-                        }
-                    )
+            session = self._session()
+            async with session.get(
+                url,
+                headers=self.config.headers,
+                proxy=self.config.proxy,
+                ssl=self.config.verify_ssl,
+                timeout=self.config.timeout
+            ) as response:
+                if response.status != 200:
+                    raise Exception(f"HTTP {response.status}: {response.reason}")
+                
+                html_content = await response.text()
+                soup = BeautifulSoup(html_content, 'html.parser')
+                
+                # Extract title
+                title = soup.title.string if soup.title else ""
+                
+                # Extract text content
+                for script in soup(["script", "style"]):
+                    script.decompose()
+                text_content = soup.get_text(separator='\n', strip=True)
+                
+                # Extract links
+                base_url = f"{urlparse(url).scheme}://{urlparse(url).netloc}"
+                links = [
+                    urljoin(base_url, a.get('href'))
+                    for a in soup.find_all('a', href=True)
+                ]
+                
+                # Extract images
+                images = [
+                    urljoin(base_url, img.get('src'))
+                    for img in soup.find_all('img', src=True)
+                ]
+                
+                return WebData(
+                    url=url,
+                    timestamp=datetime.now().isoformat(),
+                    content=html_content,
+                    title=title,
+                    text_content=text_content,
+                    html_content=html_content,
+                    links=links,
+                    images=images,
+                    metadata={
+                        "headers": dict(response.headers),
+                        "content_type": response.headers.get('content-type'),
+                        "content_length": len(html_content),
+                        "status_code": response.status
+                    }
+                )
         except Exception as e:
             raise Exception(f"Error scraping web page: {str(e)}")
     
     async def scrape_multiple(self, urls: List[str]) -> List[WebData]:
         """Scrape multiple web pages."""
-        tasks = []
-        async with aiohttp.ClientSession() as session:
-            for url in urls:
-                if await self.validate_url(url):
-                    tasks.append(self.scrape(url))
-                await asyncio.sleep(self.config.rate_limit)
-            
-            return await asyncio.gather(*tasks)
+        return await self._scrape_many(urls)
     
     async def search(self, query: str, max_results: int = 10) -> List[Dict[str, Any]]:
         """
@@ -1,12 +1,12 @@
 import re
 from datetime import datetime
 from typing import Any, Dict, List, Optional
-import aiohttp
-import asyncio
-from bs4 import BeautifulSoup
 from pytube import YouTube, Search
 from ..base_scraper import BaseScraper, ScrapedData, ScrapingConfig
 
+# Compiled once at import and shared by every scraper instance
+_URL_PATTERN = re.compile(r'^(https?://)?(www\.)?(youtube\.com|youtu\.be)/.+$')
+
 class YouTubeData(ScrapedData):
     """Model for YouTube-specific scraped data."""
     title: str
@@ -24,11 +24,11 @@ class YouTubeScraper(BaseScraper):
     
     def __init__(self, config: Optional[ScrapingConfig] = None):
         super().__init__(config)
-        self._url_pattern = r'^(https?://)?(www\.)?(youtube\.com|youtu\.be)/.+$'
+        self._url_pattern = _URL_PATTERN
     
     async def validate_url(self, url: str) -> bool:
         """Check if URL is a valid YouTube URL."""
-        return bool(re.match(self._url_pattern, url))
+        return bool(self._url_pattern.match(url))
     
     async def scrape(self, url: str) -> YouTubeData:
         """Scrape data from a YouTube video URL."""
@@ -89,14 +89,7 @@ class YouTubeScraper(BaseScraper):
     
     async def scrape_multiple(self, urls: List[str]) -> List[YouTubeData]:
         """Scrape multiple YouTube videos."""
-        tasks = []
-        async with aiohttp.ClientSession() as session:
-            for url in urls:
-                if await self.validate_url(url):
-                    tasks.append(self.scrape(url))
-                await asyncio.sleep(self.config.rate_limit)
-            
-            return await asyncio.gather(*tasks)
+        return await self._scrape_many(urls)
     
     async def search(self, query: str, max_results: int = 10) -> List[Dict[str, Any]]:
         """Search for YouTube videos."""
@@ -13,13 +13,17 @@ class RateLimiter:
     
     async def acquire(self, domain: Optional[str] = None) -> None:
         """Wait if necessary to maintain the rate limit."""
+        # Reserve the next slot for the domain under the lock, but sleep
+        # outside of it so other domains are not blocked meanwhile
         async with self._lock:
-            now = time.time()
+            now = time.monotonic()
+            wait = 0.0
             if domain in self.last_request_time:
-                elapsed = now - self.last_request_time[domain]
-                if elapsed < self.rate:
-                    await asyncio.sleep(self.rate - elapsed)
-            self.last_request_time[domain] = time.time()
+                wait = max(0.0, self.last_request_time[domain] + self.rate - now)
+            self.last_request_time[domain] = now + wait
+        
+        if wait > 0:
+            await asyncio.sleep(wait)
     
     def reset(self, domain: Optional[str] = None) -> None:
         """Reset the rate limiter for a specific domain or all domains."""
@@ -5,7 +5,7 @@ Implementación de almacenamiento usando Supabase.
 from typing import List, Dict, Any, Optional, Tuple
 import logging
 from datetime import datetime
-import numpy as np
+from collections import defaultdict
 from supabase import create_client, Client
 from sentence_transformers import SentenceTransformer
 import json
@@ -106,8 +106,8 @@ class SupabaseStorage:
                     "topics": fragment.topics,
                     "confidence_score": fragment.confidence_score,
                     "embedding": fragment.embedding,
-                    "frame_count": fragment.frame_count if hasattr(fragment, 'frame_count') else None,
-                    "scene_change": fragment.scene_change if hasattr(fragment, 'scene_change') else False
+                    "frame_count": fragment.frame_count,
+                    "scene_change": fragment.scene_change
                 }
                 fragment_batch.append(fragment_data)
                 
@@ -130,7 +130,7 @@ class SupabaseStorage:
                     "context": citation.context,
                     "page_number": citation.page_number,
                     "accessed_date": citation.accessed_date.isoformat(),
-                    "timestamp": citation.timestamp if hasattr(citation, 'timestamp') else None
+                    "timestamp": citation.timestamp
                 }
                 citation_batch.append(citation_data)
                 
@@ -188,25 +188,40 @@ class SupabaseStorage:
                 rpc_params
             ).execute()
             
+            # Cargar items y fragmentos de todas las coincidencias con una
+            # consulta por tabla, agrupando los fragmentos por item
+            item_ids = list({match["item_id"] for match in results.data})
+            items_by_id = {}
+            fragments_by_item = defaultdict(list)
+            if item_ids:
+                items_result = self.supabase.table("knowledge_items")\
+                    .select("*")\
+                    .in_("id", item_ids)\
+                    .execute()
+                items_by_id = {row["id"]: row for row in items_result.data}
+                
+                fragments_result = self.supabase.table("knowledge_fragments")\
+                    .select("*")\
+                    .in_("item_id", item_ids)\
+                    .execute()
+                for row in fragments_result.data:
+                    fragments_by_item[row["item_id"]].append(row)
+            
             # Procesar resultados
             search_results = []
             for match in results.data:
-                # Obtener item completo
-                item_result = self.supabase.table("knowledge_items")\
-                    .select("*")\
-                    .eq("id", match["item_id"])\
-                    .execute()
-                    
-                if not item_result.data:
+                item_data = items_by_id.get(match["item_id"])
+                if not item_data:
                     continue
-                    
-                item_data = item_result.data[0]
                 
                 # Reconstruir KnowledgeItem
                 item = KnowledgeItem(
                     id=item_data["id"],
                     source=item_data["source"],
-                    fragments=self._get_item_fragments(item_data["id"]),
+                    fragments=[
+                        KnowledgeFragment(**f)
+                        for f in fragments_by_item[item_data["id"]]
+                    ],
                     summary=item_data["summary"],
                     main_topics=item_data["main_topics"],
                     metadata=item_data["metadata"],
@@ -235,19 +250,13 @@ class SupabaseStorage:
             logger.error(f"Error en búsqueda: {str(e)}")
             raise
             
-    def _get_item_fragments(self, item_id: str) -> List[KnowledgeFragment]:
-        """Obtiene todos los fragmentos de un item."""
-        result = self.supabase.table("knowledge_fragments")\
-            .select("*")\
-            .eq("item_id", item_id)\
-            .execute()
-            
-        return [KnowledgeFragment(**f) for f in result.data]
-        
     def _build_context(self, fragments: List[KnowledgeFragment]) -> str:
         """Construye contexto a partir de fragmentos."""
         if not fragments:
             return ""
+        if len(fragments) == 1:
+            # Un solo fragmento: no hay nada que ordenar ni unir
+            return fragments[0].content
             
         # Ordenar por tiempo si es video
         if all(f.start_time is not None for f in fragments):
@@ -1,6 +1,5 @@
 from typing import Dict, List, Any, Optional
 from datetime import datetime
-import numpy as np
 from supabase import create_client, Client
 from sentence_transformers import SentenceTransformer
 import logging
@@ -160,14 +159,20 @@ class SupabaseKnowledgeBase:
             Dict con estadísticas como total de videos, conceptos, etc.
         """
         try:
-            # Obtener total de videos
-            videos_result = self.supabase.table('videos').select("*", count='exact').execute()
-            total_videos = len(videos_result.data) if videos_result.data else 0
+            # Total de videos (conteo exacto en el servidor) y el más reciente,
+            # sin descargar la tabla completa
+            videos_result = (
+                self.supabase.table('videos')
+                .select("created_at", count='exact')
+                .order('created_at', desc=True)
+                .limit(1)
+                .execute()
+            )
+            total_videos = videos_result.count or 0
             
             # Obtener fecha de última actualización
             if videos_result.data:
-                latest_video = max(videos_result.data, key=lambda x: x['created_at'])
-                last_update = latest_video['created_at']
+                last_update = videos_result.data[0]['created_at']
             else:
                 last_update = "N/A"
             
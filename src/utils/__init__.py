@@ -0,0 +1,7 @@
+"""
+Utilidades compartidas entre los distintos módulos.
+"""
+
+from .lru_cache import LRUCache
+
+__all__ = ['LRUCache']
@@ -0,0 +1,48 @@
+"""
+Caché LRU acotada para valores calculados en memoria.
+"""
+from collections import OrderedDict
+from typing import Generic, Optional, TypeVar
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+class LRUCache(Generic[K, V]):
+    """
+    Diccionario acotado que descarta la entrada usada hace más tiempo.
+    
+    Cubre los casos en que functools.lru_cache no sirve: cachés por
+    instancia, valores con expiración o entradas que hay que invalidar.
+    """
+    
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._entries: "OrderedDict[K, V]" = OrderedDict()
+    
+    def get(self, key: K) -> Optional[V]:
+        """Retorna el valor y lo marca como el más reciente, o None si no está."""
+        value = self._entries.get(key)
+        if value is not None:
+            self._entries.move_to_end(key)
+        return value
+    
+    def put(self, key: K, value: V) -> None:
+        """Guarda el valor como el más reciente, descartando los más antiguos."""
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+    
+    def pop(self, key: K) -> Optional[V]:
+        """Elimina la entrada y retorna su valor, o None si no estaba."""
+        return self._entries.pop(key, None)
+    
+    def clear(self) -> None:
+        """Elimina todas las entradas."""
+        self._entries.clear()
+    
+    def __contains__(self, key: object) -> bool:
+        return key in self._entries
+    
+    def __len__(self) -> int:
+        return len(self._entries)
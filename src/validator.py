@@ -1,12 +1,10 @@
 from langchain_core.prompts import PromptTemplate
 from langchain_openai import ChatOpenAI
-from langchain_core.runnables import RunnablePassthrough
 import logging
-from typing import Tuple, Dict, Any
+from typing import Tuple, Dict, Any, Optional
 import asyncio
-from concurrent.futures import ThreadPoolExecutor
 import json
-from datetime import datetime
+import time
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -19,7 +17,7 @@ class ContentMetrics:
         self.total_evidence_score = 0.0
         self.key_concepts = set()
         self.citations = set()
-        self.start_time = datetime.now()
+        self.start_time = time.perf_counter()
     
     def update(self, analysis_result: Dict[str, Any]):
         self.chunks_analyzed += 1
@@ -37,7 +35,7 @@ class ContentMetrics:
                 self.citations.update(analysis_result["referencias"])
     
     def get_summary(self) -> Dict[str, Any]:
-        duration = (datetime.now() - self.start_time).total_seconds()
+        duration = time.perf_counter() - self.start_time
         relevant_ratio = self.relevant_chunks / max(1, self.chunks_analyzed)
         avg_novelty = self.total_novelty_score / max(1, self.relevant_chunks)
         avg_evidence = self.total_evidence_score / max(1, self.relevant_chunks)
@@ -55,7 +53,7 @@ class ContentMetrics:
         }
 
 class NutritionValidator:
-    def __init__(self, openai_api_key: str):
+    def __init__(self, openai_api_key: str, max_concurrency: int = 2):
         self.llm = ChatOpenAI(temperature=0, api_key=openai_api_key)
         self.prompt = PromptTemplate(
             input_variables=["transcript"],
@@ -84,16 +82,19 @@ Responde SOLO en formato JSON con este esquema exacto:
 }}"""
         )
         self.chain = self.prompt | self.llm
-        self.executor = ThreadPoolExecutor(max_workers=2)
+        self.max_concurrency = max_concurrency
+        self._semaphore: Optional[asyncio.Semaphore] = None
         self.metrics = ContentMetrics()
     
     async def validate_content_async(self, transcript: str) -> Tuple[bool, float, str]:
         try:
-            loop = asyncio.get_event_loop()
-            response = await loop.run_in_executor(
-                self.executor,
-                lambda: self.chain.invoke({"transcript": transcript})
-            )
+            # La llamada al LLM es I/O: se usa la API asíncrona de la cadena
+            # y se limita la concurrencia con un semáforo
+            if self._semaphore is None:
+                self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            
+            async with self._semaphore:
+                response = await self.chain.ainvoke({"transcript": transcript})
             
             try:
                 content = response.content
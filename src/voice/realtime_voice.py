@@ -3,8 +3,7 @@ from fastapi.middleware.cors import CORSMiddleware
 import whisper
 import numpy as np
 import asyncio
-from typing import List, Optional
-import sounddevice as sd
+from typing import List, Optional, Set
 import json
 import logging
 from datetime import datetime
@@ -44,17 +43,19 @@ class AudioProcessor:
         if len(self.buffer) >= 5 and not self.processing:
             self.processing = True
             try:
-                # Convertir buffer a numpy array
+                # Convertir buffer a numpy array y liberarlo para los
+                # chunks que lleguen mientras se transcribe
                 audio_data = np.frombuffer(b''.join(self.buffer), dtype=np.float32)
-                
-                # Procesar con Whisper
-                result = self.model.transcribe(audio_data, language="es")
-                
-                # Limpiar buffer
                 self.buffer = []
+                
+                # Procesar con Whisper fuera del event loop
+                result = await asyncio.get_event_loop().run_in_executor(
+                    None,
+                    lambda: self.model.transcribe(audio_data, language="es")
+                )
                 return result["text"]
             except Exception as e:
-                logger.error(f"Error procesando audio: {e}")
+                logger.error("Error procesando audio: %s", e)
                 return None
             finally:
                 self.processing = False
@@ -62,16 +63,16 @@ class AudioProcessor:
 
 class ConnectionManager:
     def __init__(self):
-        self.active_connections: List[WebSocket] = []
+        self.active_connections: Set[WebSocket] = set()
         self.audio_processor = AudioProcessor()
 
     async def connect(self, websocket: WebSocket):
         await websocket.accept()
-        self.active_connections.append(websocket)
+        self.active_connections.add(websocket)
         logger.info(f"Nueva conexión establecida. Total: {len(self.active_connections)}")
 
     def disconnect(self, websocket: WebSocket):
-        self.active_connections.remove(websocket)
+        self.active_connections.discard(websocket)
         logger.info(f"Conexión cerrada. Total: {len(self.active_connections)}")
 
     async def process_audio_stream(self, websocket: WebSocket):
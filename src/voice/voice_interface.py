@@ -4,7 +4,6 @@ import tempfile
 import asyncio
 import numpy as np
 import sounddevice as sd
-import soundfile as sf
 from TTS.api import TTS
 import whisper
 import torch
@@ -12,9 +11,12 @@ from rich.console import Console
 from typing import Optional, Callable, Awaitable
 import wave
 from datetime import datetime
-import resampy
 import pygame
 
+# Palabras de activación y de salida (conjuntos para búsqueda por hash)
+WAKE_WORDS = frozenset({"nutrición", "agente", "consulta", "ayuda"})
+EXIT_WORDS = frozenset({"salir", "terminar", "adiós", "chau"})
+
 def list_audio_devices():
     """Lista todos los dispositivos de audio disponibles"""
     print("\nDispositivos de audio disponibles:")
@@ -191,21 +193,15 @@ class VoiceInterface:
                 print("\n⚠️ No se detectó audio!")
                 return None
             
-            # Convertir audio a numpy array
-            audio = np.concatenate(audio_data, axis=0)
-            
-            # Guardar audio en archivo temporal
-            temp_path = self._get_temp_filepath()
-            sf.write(temp_path, audio, self.RATE)
+            # Convertir audio a numpy array (mono, float32 a 16 kHz, el formato
+            # que espera Whisper, así que no hace falta pasar por un archivo)
+            audio = np.concatenate(audio_data, axis=0).reshape(-1)
             
             # Transcribir con Whisper
             print("\n🎯 Transcribiendo...")
-            result = self.model.transcribe(temp_path, language=self.language)
+            result = self.model.transcribe(audio, language=self.language)
             transcribed_text = result["text"].strip()
             
-            # Limpiar archivo temporal
-            os.remove(temp_path)
-            
             if transcribed_text:
                 print(f"\n🗣️  Texto reconocido: {transcribed_text}")
                 return transcribed_text
@@ -251,9 +247,7 @@ class VoiceInterface:
     
     def is_wake_word(self, text: str) -> bool:
         """Verifica si el texto contiene la palabra de activación"""
-        wake_words = ["nutrición", "agente", "consulta", "ayuda"]
-        words = text.lower().split()
-        return any(word in words for word in wake_words)
+        return not WAKE_WORDS.isdisjoint(text.lower().split())
     
     async def run_voice_interface(self, process_query: Callable[[str], Awaitable[str]]):
         """Ejecuta la interfaz de voz en un bucle"""
@@ -267,7 +261,7 @@ class VoiceInterface:
             while True:
                 text = await self.listen()
                 if text:
-                    if text.lower().strip() in ['salir', 'terminar', 'adiós', 'chau']:
+                    if text.lower().strip() in EXIT_WORDS:
                         print("\n👋 ¡Hasta luego!")
                         break
                     
@@ -307,7 +301,7 @@ async def main():
         
         async def process_query(query: str) -> str:
             """Procesa la consulta usando el agente de nutrición"""
-            if query.lower().strip() in ['salir', 'terminar', 'adiós', 'chau']:
+            if query.lower().strip() in EXIT_WORDS:
                 return "¡Hasta luego!"
                 
             response = await agent.answer_question(query)
@@ -0,0 +1,68 @@
+from datetime import datetime
+import pytest
+from src.auth import security
+from src.auth.models import Role, TokenPayload
+
+def _payload(expires_in: float) -> TokenPayload:
+    return TokenPayload(
+        sub="user-1",
+        role=Role.OWNER,
+        permissions=[],
+        exp=int(datetime.utcnow().timestamp() + expires_in)
+    )
+
+@pytest.fixture(autouse=True)
+def clear_token_cache():
+    security._verified_tokens.clear()
+    yield
+    security._verified_tokens.clear()
+
+def test_valid_token_is_decoded_once(monkeypatch):
+    payload = _payload(60)
+    calls = []
+    
+    def fake_decode(token):
+        calls.append(token)
+        return payload
+    
+    monkeypatch.setattr(security, "decode_token", fake_decode)
+    
+    assert security._decode_token_cached("token") is payload
+    assert security._decode_token_cached("token") is payload
+    assert calls == ["token"]
+
+@pytest.mark.asyncio
+async def test_expired_cached_token_is_redecoded_and_rejected(monkeypatch):
+    payload = _payload(60)
+    calls = []
+    
+    def fake_decode(token):
+        calls.append(token)
+        # Una vez expirado, la verificación real del JWT falla
+        return payload if len(calls) == 1 else None
+    
+    monkeypatch.setattr(security, "decode_token", fake_decode)
+    monkeypatch.setattr(security, "get_token_from_context", lambda: "token")
+    
+    @security.requires_auth()
+    async def protected():
+        return "ok"
+    
+    assert await protected() == "ok"
+    
+    # El token expira mientras sigue en caché
+    payload.exp = int(datetime.utcnow().timestamp() - 1)
+    
+    with pytest.raises(security.AuthError):
+        await protected()
+    assert calls == ["token", "token"]
+    assert "token" not in security._verified_tokens
+
+def test_cache_never_exceeds_its_size(monkeypatch):
+    monkeypatch.setattr(security, "decode_token", lambda token: _payload(60))
+    
+    for i in range(security.VERIFIED_TOKEN_CACHE_SIZE + 10):
+        security._decode_token_cached(f"token-{i}")
+    
+    assert len(security._verified_tokens) == security.VERIFIED_TOKEN_CACHE_SIZE
+    assert "token-0" not in security._verified_tokens
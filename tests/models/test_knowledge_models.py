@@ -0,0 +1,54 @@
+"""
+Tests para los modelos de la base de conocimientos.
+"""
+import numpy as np
+import pytest
+
+from src.models.knowledge_models import (
+    ContentType,
+    KnowledgeFragment,
+    KnowledgeItem,
+    SourceMetadata
+)
+
+def _make_item(embeddings):
+    """Crea un item con un fragmento por embedding."""
+    return KnowledgeItem(
+        source=SourceMetadata(
+            url="https://example.com",
+            title="Ejemplo",
+            content_type=ContentType.ARTICLE
+        ),
+        fragments=[
+            KnowledgeFragment(content=f"fragmento {i}", embedding=emb, confidence_score=0.8)
+            for i, emb in enumerate(embeddings)
+        ],
+        summary="Resumen",
+        main_topics=["nutrición"]
+    )
+
+def test_coherence_matches_pairwise_mean():
+    """La coherencia debe ser la media de las similitudes entre pares."""
+    rng = np.random.default_rng(0)
+    embeddings = [rng.random(384).tolist() for _ in range(4)]
+    item = _make_item(embeddings + [None])
+    
+    item.calculate_quality_metrics()
+    
+    expected = np.mean([
+        np.dot(embeddings[i], embeddings[j])
+        for i in range(4)
+        for j in range(i + 1, 4)
+    ])
+    assert item.quality_metrics["coherence"] == pytest.approx(expected)
+    assert item.quality_metrics["avg_confidence"] == pytest.approx(0.8)
+    # url, title, language y content_type de 9 campos
+    assert item.quality_metrics["metadata_richness"] == pytest.approx(4 / 9)
+
+def test_coherence_requires_two_embeddings():
+    """Sin al menos dos embeddings no se calcula coherencia."""
+    item = _make_item([[0.1] * 384, None])
+    
+    item.calculate_quality_metrics()
+    
+    assert "coherence" not in item.quality_metrics
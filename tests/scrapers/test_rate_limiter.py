@@ -0,0 +1,29 @@
+import asyncio
+import time
+import pytest
+from src.scrapers.utils.rate_limiter import RateLimiter
+
+@pytest.mark.asyncio
+async def test_same_domain_is_spaced():
+    limiter = RateLimiter(requests_per_second=10)
+    
+    start = time.monotonic()
+    for _ in range(3):
+        await limiter.acquire("example.com")
+    
+    assert time.monotonic() - start >= 0.2 - 0.01
+
+@pytest.mark.asyncio
+async def test_other_domains_are_not_blocked():
+    limiter = RateLimiter(requests_per_second=2)
+    await limiter.acquire("slow.com")
+    
+    # slow.com must wait ~0.5 s, but fast.com should pass immediately
+    waiting = asyncio.ensure_future(limiter.acquire("slow.com"))
+    await asyncio.sleep(0)
+    
+    start = time.monotonic()
+    await limiter.acquire("fast.com")
+    assert time.monotonic() - start < 0.1
+    
+    await waiting
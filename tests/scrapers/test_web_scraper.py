@@ -0,0 +1,196 @@
+import asyncio
+import pytest
+from src.scrapers.providers.web_scraper import WebScraper, WebData
+from src.scrapers.base_scraper import ScrapingConfig
+
+def _page(url: str) -> WebData:
+    return WebData(
+        url=url,
+        timestamp="2024-01-01T00:00:00",
+        content="<html></html>",
+        title="Example",
+        text_content="",
+        html_content="<html></html>"
+    )
+
+@pytest.mark.asyncio
+async def test_scrape_reuses_cached_page(monkeypatch):
+    scraper = WebScraper(ScrapingConfig(cache_ttl=60))
+    calls = []
+    
+    async def fake_fetch(url):
+        calls.append(url)
+        return _page(url)
+    
+    monkeypatch.setattr(scraper, "_fetch", fake_fetch)
+    
+    first = await scraper.scrape("https://example.com")
+    second = await scraper.scrape("https://example.com")
+    
+    assert first is second
+    assert calls == ["https://example.com"]
+
+@pytest.mark.asyncio
+async def test_scrape_cache_disabled(monkeypatch):
+    scraper = WebScraper(ScrapingConfig(cache_ttl=0))
+    calls = []
+    
+    async def fake_fetch(url):
+        calls.append(url)
+        return _page(url)
+    
+    monkeypatch.setattr(scraper, "_fetch", fake_fetch)
+    
+    await scraper.scrape("https://example.com")
+    await scraper.scrape("https://example.com")
+    
+    assert len(calls) == 2
+
+@pytest.mark.asyncio
+async def test_scrape_multiple_skips_failures(monkeypatch):
+    scraper = WebScraper(ScrapingConfig(rate_limit=0))
+    
+    async def fake_validate(url):
+        return "invalid" not in url
+    
+    async def fake_fetch(url):
+        if "broken" in url:
+            raise Exception("HTTP 500")
+        return _page(url)
+    
+    monkeypatch.setattr(scraper, "validate_url", fake_validate)
+    monkeypatch.setattr(scraper, "_fetch", fake_fetch)
+    
+    urls = [
+        "https://example.com",
+        "https://invalid.example.com",
+        "https://broken.example.com",
+        "https://example.org",
+    ]
+    results = await scraper.scrape_multiple(urls)
+    
+    assert [r.url for r in results] == ["https://example.com", "https://example.org"]
+
+@pytest.mark.asyncio
+async def test_scrape_cache_evicts_least_recently_used(monkeypatch):
+    scraper = WebScraper(ScrapingConfig(cache_ttl=60, cache_max_entries=2))
+    calls = []
+    
+    async def fake_fetch(url):
+        calls.append(url)
+        return _page(url)
+    
+    monkeypatch.setattr(scraper, "_fetch", fake_fetch)
+    
+    await scraper.scrape("https://a.example.com")
+    await scraper.scrape("https://b.example.com")
+    await scraper.scrape("https://a.example.com")
+    await scraper.scrape("https://c.example.com")
+    await scraper.scrape("https://a.example.com")
+    await scraper.scrape("https://b.example.com")
+    
+    assert calls == [
+        "https://a.example.com",
+        "https://b.example.com",
+        "https://c.example.com",
+        "https://b.example.com",
+    ]
+
+@pytest.mark.asyncio
+async def test_concurrent_scrapes_share_one_fetch(monkeypatch):
+    scraper = WebScraper(ScrapingConfig(cache_ttl=0))
+    calls = []
+    
+    async def fake_fetch(url):
+        calls.append(url)
+        await asyncio.sleep(0.01)
+        return _page(url)
+    
+    monkeypatch.setattr(scraper, "_fetch", fake_fetch)
+    
+    results = await asyncio.gather(
+        *(scraper.scrape("https://example.com") for _ in range(3))
+    )
+    
+    assert calls == ["https://example.com"]
+    assert all(r is results[0] for r in results)
+    assert not scraper._inflight
+
+def test_session_is_recreated_on_a_new_event_loop():
+    scraper = WebScraper(ScrapingConfig())
+    
+    async def open_session():
+        session = scraper._session()
+        assert scraper._session() is session
+        return session
+    
+    async def reopen_and_close():
+        session = scraper._session()
+        await scraper.close()
+        return session
+    
+    first = asyncio.run(open_session())
+    second = asyncio.run(reopen_and_close())
+    
+    assert second is not first
+    assert second.closed
+    assert scraper._http_session is None
+    asyncio.run(first.close())
+
+@pytest.mark.asyncio
+async def test_scrape_multiple_logs_failures(monkeypatch, caplog):
+    scraper = WebScraper(ScrapingConfig(rate_limit=0))
+    
+    async def fake_validate(url):
+        return True
+    
+    async def fake_fetch(url):
+        raise Exception("HTTP 500")
+    
+    monkeypatch.setattr(scraper, "validate_url", fake_validate)
+    monkeypatch.setattr(scraper, "_fetch", fake_fetch)
+    
+    with caplog.at_level("ERROR"):
+        results = await scraper.scrape_multiple(["https://broken.example.com"])
+    
+    assert results == []
+    assert "https://broken.example.com" in caplog.text
+
+@pytest.mark.asyncio
+async def test_page_is_cached_when_all_waiters_are_cancelled(monkeypatch):
+    scraper = WebScraper(ScrapingConfig(cache_ttl=60))
+    calls = []
+    
+    async def fake_fetch(url):
+        calls.append(url)
+        await asyncio.sleep(0.01)
+        return _page(url)
+    
+    monkeypatch.setattr(scraper, "_fetch", fake_fetch)
+    
+    waiter = asyncio.ensure_future(scraper.scrape("https://example.com"))
+    await asyncio.sleep(0)
+    waiter.cancel()
+    await asyncio.sleep(0.02)
+    
+    assert "https://example.com" in scraper._cache
+    await scraper.scrape("https://example.com")
+    assert calls == ["https://example.com"]
+
+@pytest.mark.asyncio
+async def test_failed_fetch_without_waiters_is_forgotten(monkeypatch):
+    scraper = WebScraper(ScrapingConfig(cache_ttl=60))
+    
+    async def fake_fetch(url):
+        await asyncio.sleep(0.01)
+        raise Exception("HTTP 500")
+    
+    monkeypatch.setattr(scraper, "_fetch", fake_fetch)
+    
+    waiter = asyncio.ensure_future(scraper.scrape("https://broken.example.com"))
+    await asyncio.sleep(0)
+    waiter.cancel()
+    await asyncio.sleep(0.02)
+    
+    assert not scraper._inflight
+    assert "https://broken.example.com" not in scraper._cache